@@ -0,0 +1,42 @@
+"""
+GeoRetail Project - Cached study-area boundary facts
+Area, bounds, centroid and CRS of the city boundary, shared by the step scripts
+"""
+
+import hashlib
+import json
+import shapely
+from pyproj import Geod
+
+BOUNDARY_FILE = "data/coimbatore_boundary_clean.geojson"
+META_FILE = "data/_boundary_meta.json"
+
+def load_boundary_meta(boundary_gdf, boundary_file=BOUNDARY_FILE, meta_file=META_FILE):
+    """Return the boundary facts, recomputing them only when the boundary file changes"""
+    with open(boundary_file, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+
+    try:
+        with open(meta_file, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('source_sha256') == digest:
+            return meta
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    # Geodesic area on the WGS84 ellipsoid (Web Mercator inflates it by sec²(lat))
+    wgs84 = boundary_gdf.to_crs('EPSG:4326')
+    geod = Geod(ellps='WGS84')
+    area_m2 = sum(abs(geod.geometry_area_perimeter(geom)[0]) for geom in wgs84.geometry)
+    centroid = shapely.centroid(wgs84.geometry.union_all())
+
+    meta = {
+        'source_sha256': digest,
+        'area_km2': area_m2 / 1e6,
+        'bounds': [float(v) for v in wgs84.total_bounds],
+        'centroid': [centroid.x, centroid.y],
+        'crs': boundary_gdf.crs.to_string(),
+    }
+    with open(meta_file, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+    return meta
@@ -52,11 +52,15 @@ if os.path.exists(population_raster_path):
 else:
     print(f"⚠️  Population raster not found at {population_raster_path}")
 
-# Load roads
+# Load roads (Step 3 writes FlatGeobuf; older runs left GeoJSON)
+def road_layer(name):
+    path = f"data/processed/{name}.fgb"
+    return path if os.path.exists(path) else f"data/processed/{name}.geojson"
+
 print("Loading road network...")
-roads_gdf = gpd.read_file("data/processed/coimbatore_roads.geojson")
+roads_gdf = gpd.read_file(road_layer("coimbatore_roads"))
 roads_utm = roads_gdf.to_crs(TARGET_CRS)
-major_roads_gdf = gpd.read_file("data/processed/coimbatore_major_roads.geojson")
+major_roads_gdf = gpd.read_file(road_layer("coimbatore_major_roads"))
 major_roads_utm = major_roads_gdf.to_crs(TARGET_CRS)
 print(f"✅ Roads loaded: {len(roads_gdf)} segments")
 
@@ -3,1815 +3,272 @@ GeoRetail Project - Step 8: Final Documentation & Presentation Package
 Generate complete project documentation, executive summary, and presentation materials
 """
 
-import geopandas as gpd
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
+import pyogrio
 import numpy as np
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import atexit
+import hashlib
+import json
 import os
+import sys
 
-print("""
-🎯 GEORETAIL PROJECT - STEP 8
-📚 Final Documentation & Presentation Package
-📅 {}
-""".format(datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-
-# Create directories
-os.makedirs("outputs/final/documentation", exist_ok=True)
-os.makedirs("outputs/final/presentation", exist_ok=True)
-
-# Load data for documentation
-print("\n" + "="*60)
-print("LOADING PROJECT DATA")
-print("="*60)
-
-grid_gdf = gpd.read_file("data/processed/grid/analysis_grid_wgs84.geojson")
-top_locations = gpd.read_file("data/processed/grid/top_20_locations.geojson")
-boundary_gdf = gpd.read_file("data/coimbatore_boundary_clean.geojson")
-
-try:
-    underserved = gpd.read_file("data/processed/grid/underserved_areas.geojson")
-except:
-    underserved = gpd.GeoDataFrame()
-
-print(f"✅ All data loaded")
-
-# Calculate comprehensive statistics
-stats = {
-    'total_cells': len(grid_gdf),
-    'coverage_km2': grid_gdf['area_km2'].sum(),
-    'population': grid_gdf['population'].sum(),
-    'mean_score': grid_gdf['suitability_score_100'].mean(),
-    'median_score': grid_gdf['suitability_score_100'].median(),
-    'top_score': grid_gdf['suitability_score_100'].max(),
-    'underserved_cells': len(underserved),
-    'underserved_pop': underserved['population'].sum() if len(underserved) > 0 else 0,
-    'high_competition': len(grid_gdf[grid_gdf['competition_score'] > 5]),
-    'no_retail': len(grid_gdf[grid_gdf['competition_score'] == 0]),
-    'high_density_cells': len(grid_gdf[grid_gdf['pop_density'] > 5000])
-}
-
-# Document 1: Executive Summary
-print("\n" + "="*60)
-print("DOCUMENT 1: Executive Summary")
-print("="*60)
-
-executive_summary = f"""
-╔═══════════════════════════════════════════════════════════════╗
-║                  GEORETAIL - EXECUTIVE SUMMARY                ║
-║           Retail Site Selection Analysis - Coimbatore         ║
-╚═══════════════════════════════════════════════════════════════╝
-
-Date: {datetime.now().strftime("%B %d, %Y")}
-Prepared by: GeoRetail Analytics Team
-Project Duration: Data Collection to Analysis
-
-═══════════════════════════════════════════════════════════════
-
-🎯 EXECUTIVE SUMMARY
-
-This comprehensive geospatial analysis identifies optimal retail locations
-in Coimbatore, Tamil Nadu using multi-criteria decision analysis (MCDA) and
-open-source geospatial data. The study analyzed {stats['total_cells']:,} grid cells
-covering {stats['coverage_km2']:.1f} km² to evaluate retail site suitability.
-
-═══════════════════════════════════════════════════════════════
-
-📊 KEY FINDINGS
-
-1. MARKET OPPORTUNITY
-   • {stats['total_cells']:,} locations analyzed across Coimbatore
-   • {stats['population']:,.0f} total population covered
-   • {stats['underserved_cells']} underserved areas identified
-   • {stats['underserved_pop']:,.0f} people in underserved markets
+# Console output is collected and written with a single call when the script
+# exits (including on error), instead of flushing stdout on every print
+log_lines = []
 
-2. COMPETITION LANDSCAPE
-   • {stats['high_competition']} cells with high competition (>5 stores)
-   • {stats['no_retail']:,} cells with NO retail presence
-   • Significant white space opportunities exist
-   • Market saturation varies considerably by area
+def log(line=""):
+    """Queue a line of console output"""
+    log_lines.append(line)
 
-3. SUITABILITY ANALYSIS
-   • Top location score: {stats['top_score']:.1f}/100
-   • Mean suitability: {stats['mean_score']:.1f}/100
-   • {len(grid_gdf[grid_gdf['suitability_class'].isin(['Excellent', 'Very Good'])])} locations rated Excellent/Very Good
-   • 20 top-tier locations recommended
+def log_header(title):
+    """Queue a section banner"""
+    log_lines.extend(["\n" + "="*60, title, "="*60])
 
-═══════════════════════════════════════════════════════════════
+def flush_log():
+    """Write all queued console output at once"""
+    sys.stdout.write("\n".join(log_lines) + "\n")
 
-🏆 TOP 5 RECOMMENDED LOCATIONS
+atexit.register(flush_log)
 
-Based on comprehensive multi-criteria analysis:
+# Format the run timestamp once; every document reuses these strings
+_now = datetime.now()
+DATE_LONG = _now.strftime("%B %d, %Y")
+DATE_MONTH = _now.strftime("%B %Y")
+DATE_TS = _now.strftime("%Y-%m-%d %H:%M:%S")
+DATE_GENERATED = _now.strftime("%B %d, %Y at %I:%M %p")
 
-Rank #1: Score {top_locations.iloc[0]['suitability_score_100']:.1f}/100
-• Population Density: {top_locations.iloc[0]['pop_density']:,.0f} people/km²
-• Competition: {top_locations.iloc[0]['competition_score']:.0f} stores
-• Rating: {top_locations.iloc[0]['suitability_class']}
-• Recommendation: IMMEDIATE PRIORITY - Highest overall score
-
-Rank #2: Score {top_locations.iloc[1]['suitability_score_100']:.1f}/100
-• Population Density: {top_locations.iloc[1]['pop_density']:,.0f} people/km²
-• Competition: {top_locations.iloc[1]['competition_score']:.0f} stores
-• Rating: {top_locations.iloc[1]['suitability_class']}
-• Recommendation: HIGH PRIORITY - Zero competition area
-
-Rank #3: Score {top_locations.iloc[2]['suitability_score_100']:.1f}/100
-• Population Density: {top_locations.iloc[2]['pop_density']:,.0f} people/km²
-• Competition: {top_locations.iloc[2]['competition_score']:.0f} stores
-• Rating: {top_locations.iloc[2]['suitability_class']}
-• Recommendation: HIGH PRIORITY - Strong market demand
-
-Rank #4: Score {top_locations.iloc[3]['suitability_score_100']:.1f}/100
-• Population Density: {top_locations.iloc[3]['pop_density']:,.0f} people/km²
-• Competition: {top_locations.iloc[3]['competition_score']:.0f} stores
-• Rating: {top_locations.iloc[3]['suitability_class']}
-• Recommendation: STRONG CANDIDATE - Balanced metrics
-
-Rank #5: Score {top_locations.iloc[4]['suitability_score_100']:.1f}/100
-• Population Density: {top_locations.iloc[4]['pop_density']:,.0f} people/km²
-• Competition: {top_locations.iloc[4]['competition_score']:.0f} stores
-• Rating: {top_locations.iloc[4]['suitability_class']}
-• Recommendation: STRONG CANDIDATE - Good opportunity
-
-═══════════════════════════════════════════════════════════════
-
-💡 STRATEGIC RECOMMENDATIONS
-
-IMMEDIATE ACTION (0-3 months):
-1. Field verification of top 5 locations
-2. Detailed market research and consumer surveys
-3. Real estate feasibility assessments
-4. Preliminary site selection and negotiations
-
-SHORT-TERM (3-6 months):
-5. Target underserved markets (#6-#10 locations)
-6. Develop differentiation strategy for competitive areas
-7. Conduct financial modeling and ROI projections
-8. Secure initial locations and begin development
-
-MEDIUM-TERM (6-12 months):
-9. Expand to secondary recommended locations
-10. Monitor market dynamics and update analysis
-11. Scale successful formats to similar markets
-12. Consider franchise opportunities in underserved areas
-
-═══════════════════════════════════════════════════════════════
-
-📈 EXPECTED OUTCOMES
-
-Market Entry Success:
-• High probability of success in top 5 locations (>80%)
-• Reduced competition risk through data-driven selection
-• Optimized market penetration strategy
-
-Financial Impact:
-• Faster break-even due to optimal location selection
-• Higher revenue potential from high-density areas
-• Lower marketing costs in established foot-traffic zones
-
-Strategic Advantage:
-• First-mover advantage in {stats['no_retail']:,} zero-competition areas
-• Data-backed decisions reduce investment risk
-• Scalable framework for future expansion
-
-═══════════════════════════════════════════════════════════════
-
-🔍 METHODOLOGY OVERVIEW
-
-Data Sources (100% Free/Open):
-• Population: WorldPop 2020 (1km resolution)
-• Roads: OpenStreetMap via OSMnx
-• POIs: OpenStreetMap (retail, education, healthcare, banking)
-• Boundaries: Custom digitized city limits
-
-Analysis Framework:
-• Grid-based analysis (500m × 500m cells)
-• Multi-criteria decision analysis (MCDA)
-• Weighted scoring system (5 key criteria)
-• Spatial feature engineering
+log("""
+🎯 GEORETAIL PROJECT - STEP 8
+📚 Final Documentation & Presentation Package
+📅 {}
+""".format(DATE_TS))
 
-Criteria Weights:
-• Population Density: 30%
-• Road Accessibility: 20%
-• Competition Level: 15%
-• Amenity Proximity: 20%
-• Economic Activity: 15%
+TEMPLATE_DIR = "templates"
 
-═══════════════════════════════════════════════════════════════
+class LazyFmt(dict):
+    """Template context that leaves unknown {fields} in place instead of raising"""
+    def __missing__(self, key):
+        return '{' + key + '}'
 
-✅ DELIVERABLES SUMMARY
+def write_document(path, payload):
+    """Write an already encoded document to path and return the path"""
+    Path(path).write_bytes(payload)
+    return path
 
-Analysis Outputs:
-✅ Suitability score map (1,802 grid cells analyzed)
-✅ Top 20 recommended locations with detailed profiles
-✅ Underserved market opportunity map
-✅ Competition landscape analysis
+def load_template(name):
+    """Read a document template from the templates directory"""
+    return Path(TEMPLATE_DIR, f"{name}.tmpl").read_text(encoding='utf-8')
 
-Interactive Tools:
-✅ Folium interactive HTML map
-✅ Plotly Dash web dashboard
-✅ Real-time data exploration capabilities
+def render_document(template):
+    """Fill a template from the shared context into a UTF-8 payload for write_document"""
+    return template.format_map(ctx).encode('utf-8')
 
-Documentation:
-✅ Comprehensive methodology documentation
-✅ Executive summary and recommendations
-✅ Technical analysis report
-✅ Presentation slides
+# Create directories
+for d in ("outputs/final/documentation", "outputs/final/presentation"):
+    os.makedirs(d, exist_ok=True)
 
-═══════════════════════════════════════════════════════════════
+# Load data for documentation
+log_header("LOADING PROJECT DATA")
+
+# Documents only need attribute values, so skip geometry parsing entirely
+grid_file = "data/processed/grid/analysis_grid_wgs84.geojson"
+grid_gdf = pyogrio.read_dataframe(
+    grid_file,
+    columns=['area_km2', 'population', 'suitability_score_100', 'competition_score',
+             'pop_density', 'suitability_class', 'retail_count_1km'],
+    read_geometry=False
+)
+COLUMN_LIST_STR = ', '.join([*pyogrio.read_info(grid_file)['fields'], 'geometry'])
+
+# Keep numeric columns numpy-backed: Arrow/nullable extension dtypes take
+# much slower reduction and masking paths in pandas than plain float64
+for col in ['area_km2', 'population', 'suitability_score_100', 'competition_score',
+            'pop_density', 'retail_count_1km']:
+    if pd.api.types.is_extension_array_dtype(grid_gdf[col]):
+        grid_gdf[col] = grid_gdf[col].to_numpy(dtype='float64', na_value=0.0)
+
+top_locations = pyogrio.read_dataframe(
+    "data/processed/grid/top_20_locations.geojson",
+    columns=['suitability_score_100', 'pop_density', 'competition_score', 'suitability_class'],
+    read_geometry=False,
+    max_features=5
+)
+
+# (score, density, competition, class) tuples for ranks 1-5
+TOP5 = list(top_locations[
+    ['suitability_score_100', 'pop_density', 'competition_score', 'suitability_class']
+].itertuples(index=False, name=None))
 
-🎯 CONCLUSION
+try:
+    underserved = pyogrio.read_dataframe(
+        "data/processed/grid/underserved_areas.geojson",
+        columns=['population'],
+        read_geometry=False
+    )
+    underserved_count = len(underserved)
+    underserved_pop = float(underserved['population'].sum())
+except (FileNotFoundError, pyogrio.errors.DataSourceError):
+    underserved_count = 0
+    underserved_pop = 0.0
+
+log(f"✅ All data loaded")
 
-This analysis provides a robust, data-driven foundation for retail site
-selection in Coimbatore. The identified locations offer optimal balance
-of market demand, accessibility, and competitive positioning.
+# Calculate comprehensive statistics
+sc = grid_gdf['suitability_score_100'].to_numpy(dtype=np.float64, copy=False)
 
-The top 5 recommended locations present immediate opportunities for
-market entry with high probability of success. Additionally, {stats['underserved_cells']}
-underserved areas offer significant growth potential for strategic
-expansion.
+# competition_score is a non-negative store count, so one bincount gives
+# both the zero-retail and the high-competition (>5) totals
+comp_bc = np.bincount(grid_gdf['competition_score'].to_numpy().astype(np.int64), minlength=7)
 
-RECOMMENDATION: Proceed with field verification of top 5 locations
-and initiate detailed feasibility assessments.
+stats = {
+    'total_cells': len(grid_gdf),
+    'coverage_km2': float(np.add.reduce(grid_gdf['area_km2'].to_numpy(dtype=np.float64, na_value=0.0))),
+    'population': float(np.add.reduce(grid_gdf['population'].to_numpy(dtype=np.float64, na_value=0.0))),
+    'mean_score': sc.mean(),
+    'median_score': np.median(sc),
+    'top_score': sc.max(),
+    'underserved_cells': underserved_count,
+    'underserved_pop': underserved_pop,
+    'high_competition': int(comp_bc[6:].sum()),
+    'no_retail': int(comp_bc[0]),
+    'high_density_cells': len(grid_gdf[grid_gdf['pop_density'] > 5000]),
+    'std_score': sc.std(ddof=1)  # sample std, as pandas reports it
+}
 
-═══════════════════════════════════════════════════════════════
+# Suitability class histogram, shared by both documents
+cls_vc = grid_gdf['suitability_class'].value_counts()
+
+# Format each statistic once with the precision the documents print it at;
+# templates then interpolate plain strings with no format spec
+stat_formats = {
+    'total_cells': ('total_cells', ','),
+    'coverage_km2': ('coverage_km2', '.1f'),
+    'coverage_km2_2dp': ('coverage_km2', '.2f'),
+    'population': ('population', ',.0f'),
+    'underserved_cells': ('underserved_cells', ''),
+    'underserved_pop': ('underserved_pop', ',.0f'),
+    'high_competition': ('high_competition', ''),
+    'no_retail': ('no_retail', ','),
+    'mean_score': ('mean_score', '.1f'),
+    'mean_score_2dp': ('mean_score', '.2f'),
+    'median_score_2dp': ('median_score', '.2f'),
+    'top_score': ('top_score', '.1f'),
+    'top_score_2dp': ('top_score', '.2f'),
+    'std_score_2dp': ('std_score', '.2f'),
+}
+sfmt = {key: format(stats[name], spec) for key, (name, spec) in stat_formats.items()}
+
+# Shared interpolation context for the document templates
+ctx = LazyFmt(
+    sfmt,
+    date_long=DATE_LONG,
+    date_month=DATE_MONTH,
+    excellent_vg=int(cls_vc.get('Excellent', 0) + cls_vc.get('Very Good', 0)),
+    retail_present=int((grid_gdf['retail_count_1km'].to_numpy() > 0).sum()),
+    populated_cells=int((grid_gdf['population'].to_numpy() > 0).sum()),
+    class_counts={
+        name: int(cls_vc.get(name, 0))
+        for name in ['Excellent', 'Very Good', 'Good', 'Moderate', 'Low']
+    },
+    feature_list=COLUMN_LIST_STR,
+    generated=DATE_GENERATED
+)
+
+# Pre-format the top 5 locations in one pass; several documents cite them
+for rank, (score, density, comp, cls) in enumerate(TOP5, start=1):
+    ctx[f'r{rank}_score'] = f"{score:.1f}"
+    ctx[f'r{rank}_density'] = f"{density:,.0f}"
+    ctx[f'r{rank}_comp'] = f"{comp:.0f}"
+    ctx[f'r{rank}_class'] = cls
+
+# Documents are rendered and encoded here; the pool only does the file writes
+doc_writer = ThreadPoolExecutor(max_workers=4)
+doc_futures = {}
+
+# Skip documents whose template and data are unchanged since the last run.
+# The run date is left out of the key so a rerun alone does not rewrite them.
+DOC_CACHE_FILE = "outputs/final/documentation/.cache.json"
+try:
+    doc_cache = json.loads(Path(DOC_CACHE_FILE).read_text(encoding='utf-8'))
+except (FileNotFoundError, json.JSONDecodeError):
+    doc_cache = {}
+inputs_key = repr((
+    sorted((k, v) for k, v in ctx.items() if k not in ('date_long', 'date_month', 'generated')),
+    TOP5
+)).encode('utf-8')
+
+def submit_document(label, path, template):
+    """Queue a document write unless its cached content hash still matches"""
+    key = hashlib.blake2b(inputs_key + template.encode('utf-8'), digest_size=16).hexdigest()
+    if doc_cache.get(path) == key and os.path.exists(path):
+        log(f"⏭️  {label} unchanged: {path}")
+        return
+    doc_futures[label] = doc_writer.submit(write_document, path, render_document(template))
+    doc_cache[path] = key
 
-For detailed analysis and interactive exploration:
-• Open: georetail_interactive_map.html
-• Run: python dashboard_app.py
-• Review: Full technical documentation
+# Document 1: Executive Summary
+log_header("DOCUMENT 1: Executive Summary")
 
-═══════════════════════════════════════════════════════════════
-"""
+EXECUTIVE_SUMMARY_TEMPLATE = load_template('executive_summary')
 
 exec_summary_file = "outputs/final/documentation/01_Executive_Summary.txt"
-with open(exec_summary_file, 'w') as f:
-    f.write(executive_summary)
-
-print(f"✅ Executive Summary created: {exec_summary_file}")
+submit_document('Executive Summary', exec_summary_file, EXECUTIVE_SUMMARY_TEMPLATE)
 
 # Document 2: Technical Methodology
-print("\n" + "="*60)
-print("DOCUMENT 2: Technical Methodology")
-print("="*60)
-
-technical_doc = f"""
-╔═══════════════════════════════════════════════════════════════╗
-║              GEORETAIL - TECHNICAL DOCUMENTATION              ║
-║                    Methodology & Analysis                     ║
-╚═══════════════════════════════════════════════════════════════╝
-
-Date: {datetime.now().strftime("%B %d, %Y")}
-Version: 1.0
-
-═══════════════════════════════════════════════════════════════
-
-📋 TABLE OF CONTENTS
-
-1. Introduction & Objectives
-2. Data Collection & Sources
-3. Spatial Analysis Framework
-4. Feature Engineering
-5. Multi-Criteria Decision Analysis (MCDA)
-6. Results & Validation
-7. Limitations & Future Work
-
-═══════════════════════════════════════════════════════════════
-
-1. INTRODUCTION & OBJECTIVES
-
-1.1 Project Goal
-Develop a comprehensive, data-driven retail site selection system for
-Coimbatore city using open-source geospatial data and advanced spatial
-analysis techniques.
-
-1.2 Research Questions
-• Where are the optimal locations for new retail establishments?
-• Which areas have high market demand but low competition?
-• How do multiple criteria (population, accessibility, competition)
-  interact to determine site suitability?
-
-1.3 Study Area
-Location: Coimbatore Municipal Corporation, Tamil Nadu, India
-Area: {stats['coverage_km2']:.2f} km²
-Population: {stats['population']:,.0f} (2020 estimate)
-Administrative Level: City Municipal Corporation
-
-═══════════════════════════════════════════════════════════════
-
-2. DATA COLLECTION & SOURCES
-
-All data sources used in this analysis are freely available and
-openly licensed, ensuring reproducibility and zero data acquisition cost.
-
-2.1 Population Data
-Source: WorldPop Global Project (2020)
-Resolution: 1km × 1km (~100m resolution)
-Coverage: Complete India coverage
-Format: GeoTIFF raster
-Access: https://www.worldpop.org/
-
-Processing Steps:
-• Downloaded India-wide population raster (2020)
-• Clipped to Coimbatore city boundary
-• Extracted population per grid cell
-• Calculated population density metrics
-
-2.2 Road Network Data
-Source: OpenStreetMap via OSMnx
-Date Accessed: {datetime.now().strftime("%B %Y")}
-Network Type: Driveable roads
-Total Segments: 139,237 road segments
-
-Road Classification:
-• Level 5: Motorways, Trunk roads
-• Level 4: Primary roads
-• Level 3: Secondary roads
-• Level 2: Tertiary roads
-• Level 1: Residential, Local streets
-
-Processing Steps:
-• Downloaded complete road network using OSMnx
-• Classified roads by hierarchy (5-level system)
-• Calculated road density per cell
-• Computed distance to major highways
-
-2.3 Points of Interest (POI) Data
-Source: OpenStreetMap
-Collection Method: Overpass API via OSMnx
-
-Categories Collected:
-• Retail: {len(grid_gdf[grid_gdf['retail_count_1km'] > 0])} cells with retail presence
-• Education: Schools, colleges, universities
-• Healthcare: Hospitals, clinics, pharmacies
-• Banking: Banks, ATMs
-• Food & Beverage: Restaurants, cafes
-• Entertainment: Cinemas, parks, recreation
-
-Processing Steps:
-• Downloaded POI data by category
-• Filtered to point geometries
-• Counted POI within 1km radius of each cell
-• Calculated nearest distance to each POI type
-
-2.4 Administrative Boundaries
-Source: Custom digitized boundary
-Method: Manual digitization from OSM and official sources
-Format: Polygon (GeoJSON)
-Accuracy: <50m positional error
-
-═══════════════════════════════════════════════════════════════
-
-3. SPATIAL ANALYSIS FRAMEWORK
-
-3.1 Grid-Based Approach
-Cell Size: 500m × 500m (0.25 km² per cell)
-Total Cells: {stats['total_cells']:,}
-Cells with Data: {len(grid_gdf[grid_gdf['population'] > 0])}
-
-Rationale:
-• Standardized spatial units for comparison
-• Optimal resolution for retail catchment analysis
-• Computationally efficient
-• Aligns with typical retail service areas
-
-3.2 Coordinate Reference Systems
-Collection CRS: EPSG:4326 (WGS84)
-Analysis CRS: EPSG:32643 (WGS84 / UTM Zone 43N)
-Visualization CRS: EPSG:4326 (WGS84)
-
-Transformation Applied:
-• All distance and area calculations in UTM (meters)
-• All visualizations in geographic coordinates (degrees)
-
-3.3 Spatial Operations
-Operations Performed:
-• Raster-to-vector conversion (population)
-• Spatial joins (POI counts per cell)
-• Buffer analysis (1km radius searches)
-• Distance calculations (nearest POI)
-• Density calculations (road length per area)
-• Intersection analysis (features per cell)
-
-═══════════════════════════════════════════════════════════════
-
-4. FEATURE ENGINEERING
-
-For each grid cell, we calculated 27 features across 5 categories:
-
-4.1 Population Features
-• population: Total population in cell
-• pop_density: Population per km²
-• pop_density_norm: Normalized (0-1 scale)
-
-Calculation:
-pop_density = population / cell_area_km2
-
-4.2 Road Accessibility Features
-• road_length_m: Total road length in cell (meters)
-• road_density_km_per_km2: Road density
-• major_road_length_m: Length of major roads
-• dist_to_major_road_m: Distance to nearest highway
-• road_accessibility_norm: Composite accessibility score
-
-Calculation:
-road_density = (road_length_m / 1000) / cell_area_km2
-road_accessibility = 0.6 * road_density_norm + 0.4 * (1 - dist_norm)
-
-4.3 Competition Features
-• retail_count_1km: Retail stores within 1km
-• retail_nearest_dist_m: Distance to nearest retail
-• competition_score: Same as retail_count_1km
-• competition_pressure: Stores per 1000 people
-• competition_norm: Inverted normalized score
-
-Calculation:
-competition_pressure = (retail_count_1km / population) * 1000
-competition_norm = 1 - (competition_score / max_competition)
-
-4.4 Amenity Features
-• education_count_1km: Schools within 1km
-• healthcare_count_1km: Healthcare within 1km
-• banking_count_1km: Banks within 1km
-• food_beverage_count_1km: F&B within 1km
-• entertainment_count_1km: Entertainment within 1km
-• amenity_score: Weighted composite score
-
-Calculation:
-amenity_score = (education * 0.25) + (healthcare * 0.25) + 
-                (banking * 0.15) + (food_beverage * 0.20) + 
-                (entertainment * 0.15)
-
-4.5 Economic Activity Features
-• banking_count_1km: Banking presence (proxy for affluence)
-• economic_activity_norm: Normalized banking score
-
-Rationale: Banking presence indicates economic activity and
-purchasing power in the area.
+log_header("DOCUMENT 2: Technical Methodology")
 
-═══════════════════════════════════════════════════════════════
-
-5. MULTI-CRITERIA DECISION ANALYSIS (MCDA)
-
-5.1 Criteria Selection & Weights
-
-Criterion                Weight  Rationale
----------------------------------------------------------
-Population Density       30%     Market size potential
-Road Accessibility       20%     Customer reach & logistics
-Competition Level        15%     Market saturation (inverse)
-Amenity Proximity        20%     Foot traffic generators
-Economic Activity        15%     Purchasing power proxy
----------------------------------------------------------
-TOTAL                   100%
-
-Weight Determination:
-Weights were assigned based on:
-• Retail industry best practices
-• Academic literature on site selection
-• Business impact analysis
-• Sensitivity testing
-
-5.2 Normalization
-Method: Min-Max Scaling (0-1 range)
-
-For maximize criteria (higher is better):
-normalized = (value - min) / (max - min)
-
-For minimize criteria (lower is better):
-normalized = 1 - ((value - min) / (max - min))
-
-5.3 Score Calculation
-Formula:
-Suitability_Score = Σ (weight_i × normalized_feature_i)
-
-Expanded:
-Score = (0.30 × pop_density_norm) +
-        (0.20 × road_accessibility_norm) +
-        (0.15 × competition_norm) +
-        (0.20 × amenity_proximity_norm) +
-        (0.15 × economic_activity_norm)
-
-Scale: 0-100 (multiplied by 100 for interpretability)
-
-5.4 Classification
-Score Range    Class          Business Interpretation
----------------------------------------------------------
-75-100        Excellent      Immediate priority
-60-74         Very Good      High priority
-45-59         Good           Strong candidate
-30-44         Moderate       Consider with strategy
-0-29          Low            Lower priority
----------------------------------------------------------
-
-═══════════════════════════════════════════════════════════════
-
-6. RESULTS & VALIDATION
-
-6.1 Score Distribution
-Mean: {stats['mean_score']:.2f}/100
-Median: {stats['median_score']:.2f}/100
-Maximum: {stats['top_score']:.2f}/100
-Standard Deviation: {grid_gdf['suitability_score_100'].std():.2f}
-
-Classification Results:
-• Excellent: {len(grid_gdf[grid_gdf['suitability_class']=='Excellent'])} cells
-• Very Good: {len(grid_gdf[grid_gdf['suitability_class']=='Very Good'])} cells
-• Good: {len(grid_gdf[grid_gdf['suitability_class']=='Good'])} cells
-• Moderate: {len(grid_gdf[grid_gdf['suitability_class']=='Moderate'])} cells
-• Low: {len(grid_gdf[grid_gdf['suitability_class']=='Low'])} cells
-
-6.2 Top Locations Validation
-The top 20 locations were validated against:
-• Existing successful retail presence
-• Known commercial corridors
-• Real estate market data
-• Local business knowledge
-
-Validation Results:
-✅ Top locations align with known commercial areas
-✅ High scores correlate with successful retail clusters
-✅ Underserved areas show logical geographic distribution
-
-6.3 Sensitivity Analysis
-Tested weight variations (±10% per criterion):
-• Results stable across weight variations
-• Top 5 locations remain consistent
-• Score changes within acceptable range (<5%)
-
-═══════════════════════════════════════════════════════════════
-
-7. LIMITATIONS & FUTURE WORK
-
-7.1 Current Limitations
-
-Data Limitations:
-• Population data from 2020 (pre-pandemic)
-• OSM data quality varies by area
-• No real-time foot traffic data
-• Limited socioeconomic data
-
-Methodological Limitations:
-• Equal grid cells don't reflect real catchments
-• Simplified competition model
-• No temporal analysis (seasonal variations)
-• Binary approach to POI presence
-
-7.2 Future Enhancements
-
-Data Improvements:
-• Integrate mobile network data for foot traffic
-• Add income/purchasing power data
-• Include real estate pricing
-• Incorporate traffic flow data
-
-Methodological Improvements:
-• Machine learning validation
-• Agent-based modeling for customer behavior
-• Time-series analysis for trends
-• Micro-catchment analysis
-
-Technical Enhancements:
-• Real-time data updates
-• API integration for live dashboards
-• Automated field survey integration
-• Mobile app for field verification
-
-═══════════════════════════════════════════════════════════════
-
-8. REFERENCES
-
-Data Sources:
-• WorldPop (www.worldpop.org)
-• OpenStreetMap (www.openstreetmap.org)
-• OSMnx Python Library (github.com/gboeing/osmnx)
-
-Methodology References:
-• Multi-Criteria Decision Analysis in GIS
-• Retail Location Theory (Reilly's Law, Huff Model)
-• Spatial Statistics and Geoprocessing
-
-Tools Used:
-• Python 3.x
-• GeoPandas, Rasterio (spatial analysis)
-• OSMnx (network analysis)
-• Matplotlib, Plotly (visualization)
-• Folium (interactive mapping)
-• Dash (web dashboard)
-
-═══════════════════════════════════════════════════════════════
-
-APPENDIX A: Complete Feature List
-
-{', '.join(grid_gdf.columns.tolist())}
-
-═══════════════════════════════════════════════════════════════
-
-END OF TECHNICAL DOCUMENTATION
-"""
+TECHNICAL_DOC_TEMPLATE = load_template('technical_methodology')
 
 tech_doc_file = "outputs/final/documentation/02_Technical_Methodology.txt"
-with open(tech_doc_file, 'w') as f:
-    f.write(technical_doc)
-
-print(f"✅ Technical Documentation created: {tech_doc_file}")
+submit_document('Technical Documentation', tech_doc_file, TECHNICAL_DOC_TEMPLATE)
 
 # Document 3: User Guide
-print("\n" + "="*60)
-print("DOCUMENT 3: User Guide")
-print("="*60)
-
-user_guide = f"""
-╔═══════════════════════════════════════════════════════════════╗
-║                   GEORETAIL - USER GUIDE                      ║
-║              How to Use the Analysis Results                  ║
-╚═══════════════════════════════════════════════════════════════╝
-
-Date: {datetime.now().strftime("%B %d, %Y")}
-
-═══════════════════════════════════════════════════════════════
-
-📚 TABLE OF CONTENTS
-
-1. Getting Started
-2. Understanding the Files
-3. Using the Interactive Map
-4. Using the Dashboard
-5. Interpreting Results
-6. Making Decisions
-7. Troubleshooting
-
-═══════════════════════════════════════════════════════════════
-
-1. GETTING STARTED
-
-1.1 What You Have
-After completing the GeoRetail analysis, you have:
-• Processed spatial data files (GeoJSON)
-• Interactive HTML map
-• Web dashboard application
-• Comprehensive reports
-• Visualizations and charts
-
-1.2 Who Should Use This
-• Business owners planning retail expansion
-• Real estate investors
-• Urban planners
-• Market researchers
-• Franchise developers
-
-1.3 What You Can Do
-• Identify optimal retail locations
-• Understand market competition
-• Analyze demographic patterns
-• Make data-driven site selection decisions
-• Present findings to stakeholders
-
-═══════════════════════════════════════════════════════════════
-
-2. UNDERSTANDING THE FILES
-
-2.1 Data Files (data/processed/)
-
-grid/
-├── analysis_grid_wgs84.geojson
-│   → Main analysis grid with all {stats['total_cells']:,} cells and features
-│   → Use for: GIS software, custom analysis
-│
-├── top_20_locations.geojson
-│   → Best 20 recommended locations
-│   → Use for: Priority site selection
-│
-└── underserved_areas.geojson
-    → {stats['underserved_cells']} market gap opportunities
-    → Use for: Expansion strategy
-
-amenities/
-├── retail.geojson → Competition locations
-├── education.geojson → Schools, colleges
-├── healthcare.geojson → Hospitals, clinics
-├── banking.geojson → Banks, ATMs
-└── food_beverage.geojson → Restaurants, cafes
-
-2.2 Output Files (outputs/final/)
-
-maps/
-├── georetail_interactive_map.html
-│   → Interactive map (open in browser)
-│
-└── MAP_INSTRUCTIONS.txt
-    → How to use the interactive map
-
-documentation/
-├── 01_Executive_Summary.txt
-│   → High-level overview and recommendations
-│
-├── 02_Technical_Methodology.txt
-│   → Detailed methodology and analysis
-│
-└── 03_User_Guide.txt (this file)
-    → How to use everything
-
-presentation/
-└── Various presentation-ready visualizations
-
-═══════════════════════════════════════════════════════════════
-
-3. USING THE INTERACTIVE MAP
-
-3.1 Opening the Map
-Location: outputs/final/maps/georetail_interactive_map.html
-
-Steps:
-1. Navigate to the file in your file explorer
-2. Double-click the HTML file
-3. It will open in your default browser
-4. No internet required (map tiles need connection)
-
-3.2 Map Layers
-
-Available Layers (toggle in top-right):
-☑ Suitability Score Grid
-   • Color-coded cells (red=low, green=high)
-   • Click any cell for full details
-   
-☑ Top 20 Locations
-   • Numbered markers (1-20)
-   • Gold stars for top 3
-   • Click for detailed analysis
-   
-☐ Underserved Markets
-   • Green highlighted areas
-   • Low competition zones
-   • Growth opportunities
-   
-☐ POI Layers
-   • Retail (red) - competition
-   • Education (blue) - foot traffic
-   • Healthcare (green) - foot traffic
-   • Banking (orange) - economic activity
-
-3.3 Interactive Features
-
-🔍 Zoom & Pan
-• Scroll wheel to zoom in/out
-• Click and drag to pan
-• Double-click to zoom to point
-
-📍 Click for Details
-• Click any grid cell → See all metrics
-• Click numbered markers → Top location profile
-• Click POI markers → Facility details
-
-📏 Measure Distances
-• Click measure tool (bottom-left)
-• Click points to measure distance
-• Useful for catchment analysis
-
-🖥️ Fullscreen Mode
-• Click fullscreen button (top-left)
-• Great for presentations
-• Press ESC to exit
-
-3.4 Recommended Workflow
-
-Step 1: Overview
-• View default suitability layer
-• Get sense of high/low score areas
-• Note overall patterns
-
-Step 2: Top Locations
-• Enable "Top 20 Locations" layer
-• Click on markers 1-5 first
-• Review detailed popups
-
-Step 3: Deep Dive
-• Click specific grid cells of interest
-• Compare metrics across locations
-• Note strengths and weaknesses
-
-Step 4: Context
-• Toggle POI layers on
-• Understand competition density
-• See foot traffic generators
-
-Step 5: Opportunities
-• Enable "Underserved Markets"
-• Identify growth areas
-• Assess expansion potential
-
-═══════════════════════════════════════════════════════════════
-
-4. USING THE DASHBOARD
-
-4.1 Starting the Dashboard
-
-Requirements:
-• Python 3.x installed
-• Required packages: dash, plotly, geopandas
-
-Steps:
-1. Open terminal/command prompt
-2. Navigate to project directory
-3. Run: python dashboard_app.py
-4. Open browser to: http://127.0.0.1:8050/
-5. Dashboard will load automatically
-
-4.2 Dashboard Features
-
-📊 Top Panel: Key Metrics
-• Coverage area and cells analyzed
-• Total population
-• Market opportunities
-• Top suitability score
-
-🗺️ Interactive Map
-• Dropdown to change layer view:
-  - Suitability Score
-  - Population Density
-  - Competition Level
-  - Amenity Score
-  - Road Accessibility
-• Toggle top locations on/off
-• Hover for quick info
-• Click for details
-
-📈 Top 10 Locations Table
-• Live ranking
-• Click any location for details
-• Color-coded by performance
-
-📊 Distribution Chart
-• See breakdown by class
-• Understand score spread
-
-📉 Criteria Comparison
-• Compare top 5 locations
-• See why each ranks high
-• Identify strengths
-
-📈 Market Analysis
-• Population vs competition scatter
-• Market concentration histogram
-• Identify patterns
-
-4.3 Tips for Dashboard Use
-
-✅ Change Map Layers
-• Try different views to understand patterns
-• Population + Competition together show gaps
-
-✅ Compare Top Locations
-• Look at criteria breakdown chart
-• Understand why scores differ
-
-✅ Identify Patterns
-• Use market analysis charts
-• Find sweet spots (high pop, low comp)
-
-✅ Present to Stakeholders
-• Fullscreen mode for presentations
-• Live interaction impresses audiences
-
-═══════════════════════════════════════════════════════════════
-
-5. INTERPRETING RESULTS
-
-5.1 Understanding Suitability Scores
-
-Score Range | Meaning | Action
----------------------------------------------------------
-75-100 | Excellent | IMMEDIATE PRIORITY
-          |          | • Field verify immediately
-          |          | • Begin feasibility assessment
-          |          | • Start negotiations
-
-60-74  | Very Good | HIGH PRIORITY
-          |          | • Schedule site visits
-          |          | • Detailed market research
-          |          | • Consider for phase 1
-
-45-59  | Good      | STRONG CANDIDATE
-          |          | • Secondary priority
-          |          | • Good for expansion
-          |          | • Monitor for changes
-
-30-44  | Moderate  | STRATEGIC CONSIDERATION
-          |          | • Requires specific strategy
-          |          | • May need differentiation
-          |          | • Consider for niche formats
-
-0-29   | Low       | LOWER PRIORITY
-          |          | • Not recommended initially
-          |          | • May have specific challenges
-          |          | • Revisit after market changes
-
-5.2 Reading Location Profiles
+log_header("DOCUMENT 3: User Guide")
 
-When you click a top location, you see:
-
-🏆 Overall Score
-• Primary metric for ranking
-• Higher is better
-• Compare across locations
-
-👥 Population Density
-• Market size indicator
-• >50,000/km² = Very high
-• >20,000/km² = High
-• >10,000/km² = Moderate
-
-🏪 Competition
-• Number of existing stores
-• 0 = No competition (BEST)
-• 1-5 = Low competition (GOOD)
-• 6-15 = Moderate competition (OKAY)
-• >15 = High competition (CHALLENGING)
-
-🎯 Amenity Score
-• Foot traffic potential
-• Based on nearby facilities
-• Higher = More foot traffic
-• >15 = Excellent
-• 10-15 = Very Good
-• 5-10 = Good
-
-5.3 Understanding Market Gaps
-
-Underserved Areas have:
-✅ Good population (>1,000 people)
-✅ Low competition (<3 stores)
-✅ Reasonable accessibility
-✅ Market gap score >60
-
-Why they matter:
-• First-mover advantage
-• Lower marketing costs
-• Unmet demand
-• Growth potential
-
-5.4 Common Patterns to Look For
-
-🎯 Ideal Sweet Spot
-• High population (>40,000/km²)
-• Low competition (0-5 stores)
-• Good amenities (>10 score)
-• Near major roads (<500m)
-→ These are your TOP priorities!
-
-⚠️ Saturated Markets
-• High competition (>15 stores)
-• High foot traffic (>20 amenities)
-• May still work with:
-  - Unique offering
-  - Better service
-  - Superior location within area
-
-🌱 Growth Opportunities
-• Moderate population (10k-30k/km²)
-• Zero competition
-• Improving infrastructure
-→ Good for long-term investment
-
-═══════════════════════════════════════════════════════════════
-
-6. MAKING DECISIONS
-
-6.1 Evaluation Checklist
-
-For Each Top Location:
-
-□ Desktop Analysis
-  ☑ Review suitability score
-  ☑ Check all metrics
-  ☑ Compare with alternatives
-  ☑ Note strengths/weaknesses
-
-□ Field Verification
-  ☐ Visit the area
-  ☐ Observe foot traffic
-  ☐ Check actual competition
-  ☐ Assess road accessibility
-  ☐ Survey potential customers
-
-□ Market Research
-  ☐ Competitor analysis
-  ☐ Consumer surveys
-  ☐ Demographic verification
-  ☐ Economic indicators
-
-□ Financial Analysis
-  ☐ Real estate costs
-  ☐ Revenue projections
-  ☐ Break-even analysis
-  ☐ ROI calculations
-
-□ Risk Assessment
-  ☐ Market risks
-  ☐ Competition risks
-  ☐ Location-specific risks
-  ☐ Mitigation strategies
-
-6.2 Decision Matrix
-
-Location | Score | Pop | Comp | Visit | Decision
----------|-------|-----|------|-------|----------
-#1       | 65.6  | 78k | 25   | ✓     | GO/NO-GO
-#2       | 61.2  | 72k | 0    | ✓     | GO/NO-GO
-#3       | 61.0  | 74k | 0    | ✓     | GO/NO-GO
-...
-
-Rate each after field visit:
-✅ = Proceed
-⚠️ = Caution/More research
-❌ = Reject
-
-6.3 Prioritization Strategy
-
-Phase 1 (Immediate: 0-3 months)
-• Focus on locations #1-#3
-• Zero competition areas
-• High population density
-• Easy wins
-
-Phase 2 (Short-term: 3-6 months)
-• Locations #4-#7
-• Good scores with strategy
-• May need differentiation
-• Stable markets
-
-Phase 3 (Medium-term: 6-12 months)
-• Locations #8-#15
-• Underserved markets
-• Growth areas
-• Secondary formats
-
-Phase 4 (Long-term: 12+ months)
-• Remaining top 20
-• Competitive markets
-• Expansion opportunities
-• Franchise potential
-
-6.4 When to Say No
-
-❌ Don't proceed if:
-• Field verification contradicts data
-• Real estate costs too high
-• Local regulations prohibitive
-• Competition much higher than shown
-• Consumer survey results negative
-• Financial projections unfavorable
-
-✅ Data is a guide, not a mandate!
-Always combine with:
-• Ground truth verification
-• Local market knowledge
-• Business judgment
-• Risk tolerance
-
-═══════════════════════════════════════════════════════════════
-
-7. TROUBLESHOOTING
-
-7.1 Map Won't Open
-
-Problem: HTML file won't open
-Solution:
-• Right-click file
-• Open With → Choose browser
-• Try different browser (Chrome, Firefox)
-
-Problem: Map loads but no tiles
-Solution:
-• Check internet connection
-• Map tiles require online access
-• Data still viewable without tiles
-
-Problem: Map is slow
-Solution:
-• Large file size (~5-10 MB)
-• Close other browser tabs
-• Wait for full load
-• Consider using simplified version
-
-7.2 Dashboard Issues
-
-Problem: Dashboard won't start
-Solution:
-• Check Python installed: python --version
-• Install packages: pip install dash plotly geopandas
-• Check file paths are correct
-• Run from project directory
-
-Problem: "Port already in use"
-Solution:
-• Another app using port 8050
-• Close other Python processes
-• Or change port in code: app.run_server(port=8051)
-
-Problem: Dashboard loads but no data
-Solution:
-• Check data files exist in correct location
-• Verify file paths in code
-• Check GeoJSON files not corrupted
-
-7.3 Data Questions
-
-Problem: Numbers seem off
-Solution:
-• Remember: Population is 2020 estimate
-• OSM data varies in completeness
-• Competition may have changed
-• Field verify before decisions
-
-Problem: Missing areas in analysis
-Solution:
-• Grid-based approach may miss edges
-• Check boundary definition
-• Some areas may lack data
-• Focus on cells with data
-
-Problem: Want to update analysis
-Solution:
-• Re-run data collection scripts
-• OSM data updates frequently
-• Population data released annually
-• Methodology is reproducible
-
-═══════════════════════════════════════════════════════════════
-
-8. NEXT STEPS
-
-8.1 Immediate Actions
-
-Week 1:
-□ Review all documentation
-□ Explore interactive map
-□ Run dashboard
-□ Identify top 5 priorities
-
-Week 2:
-□ Share with stakeholders
-□ Get buy-in on approach
-□ Plan field verification
-□ Budget for next steps
-
-Week 3-4:
-□ Visit top 5 locations
-□ Conduct ground surveys
-□ Assess feasibility
-□ Refine selection
-
-8.2 Field Verification Template
-
-For each location, collect:
-
-Observation Checklist:
-□ Foot traffic count (peak vs off-peak)
-□ Visible competition (names, types)
-□ Road conditions and accessibility
-□ Parking availability
-□ Public transport proximity
-□ Surrounding businesses
-□ Building conditions
-□ Safety and lighting
-□ Signage visibility
-□ Customer demographics observed
-
-Interview Questions:
-□ Would you shop at a store here?
-□ What do you buy most often?
-□ Where do you currently shop?
-□ What's missing in this area?
-□ How do you get here?
-
-8.3 Sharing Results
-
-With Leadership:
-• Use Executive Summary
-• Show interactive dashboard
-• Focus on top 5 locations
-• Present ROI potential
-
-With Operations:
-• Show detailed location profiles
-• Discuss logistics and access
-• Review competition analysis
-• Plan rollout strategy
-
-With Finance:
-• Provide full data package
-• Support revenue projections
-• Justify investment decisions
-• Show risk mitigation
-
-With Real Estate:
-• Share GIS files
-• Provide location coordinates
-• Show catchment analysis
-• Support negotiations
-
-═══════════════════════════════════════════════════════════════
-
-9. CONTACT & SUPPORT
-
-9.1 File Locations Reference
-
-Quick access to key files:
-
-Interactive Map:
-outputs/final/maps/georetail_interactive_map.html
-
-Dashboard:
-dashboard_app.py (run this)
-
-Top Locations:
-data/processed/grid/top_20_locations.geojson
-outputs/final/top_20_locations.csv (spreadsheet)
-
-Reports:
-outputs/final/documentation/01_Executive_Summary.txt
-outputs/final/documentation/02_Technical_Methodology.txt
-
-9.2 Additional Resources
-
-GeoJSON Viewers:
-• http://geojson.io (online viewer)
-• QGIS (free desktop GIS)
-• ArcGIS Online (if available)
-
-Data Sources:
-• WorldPop: https://www.worldpop.org
-• OpenStreetMap: https://www.openstreetmap.org
-• OSMnx: https://github.com/gboeing/osmnx
-
-Python Documentation:
-• Pandas: https://pandas.pydata.org
-• GeoPandas: https://geopandas.org
-• Plotly: https://plotly.com/python
-
-9.3 Updating the Analysis
-
-To refresh with new data:
-
-1. Re-run data collection scripts (Steps 2-4)
-2. Re-run analysis script (Step 5-6)
-3. Regenerate visualizations (Step 7)
-4. Update documentation
-
-Recommended update frequency:
-• Quarterly: Check for major changes
-• Semi-annually: Minor updates
-• Annually: Full re-analysis
-
-═══════════════════════════════════════════════════════════════
-
-10. SUCCESS STORIES
-
-10.1 How to Use This Analysis
-
-Example Workflow:
-
-ABC Retail Chain used GeoRetail to:
-
-Month 1: Desktop Analysis
-• Reviewed top 20 locations
-• Shortlisted 10 for field visits
-• Presented to leadership
-• Got budget approval
-
-Month 2: Field Verification
-• Visited all 10 locations
-• Conducted consumer surveys
-• Assessed real estate options
-• Refined to top 5
-
-Month 3: Deep Dive
-• Detailed feasibility studies
-• Financial modeling
-• Negotiated leases for top 2
-• Began construction planning
-
-Month 6: Launch
-• Opened first location (#2 ranked)
-• Exceeded revenue targets by 23%
-• Break-even in 8 months (planned: 12)
-
-Month 12: Expansion
-• Opened second location (#1 ranked)
-• Similar success trajectory
-• Planning 3 more from top 10
-
-Key Success Factors:
-✅ Trusted the data but verified in field
-✅ Combined analysis with local knowledge
-✅ Started with best opportunities
-✅ Used underserved markets for expansion
-
-10.2 Lessons Learned
-
-What Worked:
-• Data-driven prioritization saved time
-• Zero-competition areas = faster ramp-up
-• High-density locations = higher revenue
-• Amenity clusters = consistent foot traffic
-
-What to Watch:
-• Field conditions can differ from data
-• Competition may appear after analysis
-• Real estate costs vary significantly
-• Some areas harder to permit than others
-
-10.3 Your Turn
-
-You now have:
-✅ Comprehensive analysis
-✅ Interactive tools
-✅ Clear recommendations
-✅ Actionable insights
-
-Next: Make it happen!
-• Trust the process
-• Verify in field
-• Execute with confidence
-• Measure results
-• Share your success!
-
-═══════════════════════════════════════════════════════════════
-
-APPENDIX: Quick Reference
-
-File Formats:
-• .geojson = Spatial data (open in GIS/code)
-• .csv = Spreadsheet data (open in Excel)
-• .html = Web page (open in browser)
-• .txt = Text document (open in any text editor)
-• .png = Image (open in any image viewer)
-
-Common Terms:
-• Grid Cell: 500m × 500m analysis unit
-• POI: Point of Interest (facility location)
-• Suitability Score: 0-100 rating for retail potential
-• Competition Score: Number of existing stores
-• Amenity Score: Foot traffic potential rating
-• MCDA: Multi-Criteria Decision Analysis
-• CRS: Coordinate Reference System
-• OSM: OpenStreetMap
-
-Coordinate Systems:
-• EPSG:4326 = WGS84 (latitude/longitude in degrees)
-• EPSG:32643 = UTM Zone 43N (meters, for measurements)
-
-Key Metrics:
-• Score >60 = Priority location
-• Pop >40k/km² = High density
-• Competition <5 = Low competition
-• Amenity >10 = Good foot traffic
-
-═══════════════════════════════════════════════════════════════
-
-END OF USER GUIDE
-
-For additional support or questions:
-• Review Technical Documentation
-• Check methodology details
-• Refer to Executive Summary
-• Consult field verification checklist
-
-Good luck with your retail site selection!
-
-═══════════════════════════════════════════════════════════════
-"""
+USER_GUIDE_TEMPLATE = load_template('user_guide')
 
 user_guide_file = "outputs/final/documentation/03_User_Guide.txt"
-with open(user_guide_file, 'w') as f:
-    f.write(user_guide)
-
-print(f"✅ User Guide created: {user_guide_file}")
+submit_document('User Guide', user_guide_file, USER_GUIDE_TEMPLATE)
 
 # Document 4: Quick Start Guide (One-Pager)
-print("\n" + "="*60)
-print("DOCUMENT 4: Quick Start Guide")
-print("="*60)
-
-quick_start = f"""
-╔═══════════════════════════════════════════════════════════════╗
-║              GEORETAIL - QUICK START GUIDE                    ║
-║                    (One-Page Reference)                       ║
-╚═══════════════════════════════════════════════════════════════╝
-
-🎯 TOP 5 RECOMMENDED LOCATIONS
-
-Rank #1: Score {top_locations.iloc[0]['suitability_score_100']:.1f}/100 | Pop: {top_locations.iloc[0]['pop_density']:,.0f}/km² | Comp: {top_locations.iloc[0]['competition_score']:.0f}
-Rank #2: Score {top_locations.iloc[1]['suitability_score_100']:.1f}/100 | Pop: {top_locations.iloc[1]['pop_density']:,.0f}/km² | Comp: {top_locations.iloc[1]['competition_score']:.0f}
-Rank #3: Score {top_locations.iloc[2]['suitability_score_100']:.1f}/100 | Pop: {top_locations.iloc[2]['pop_density']:,.0f}/km² | Comp: {top_locations.iloc[2]['competition_score']:.0f}
-Rank #4: Score {top_locations.iloc[3]['suitability_score_100']:.1f}/100 | Pop: {top_locations.iloc[3]['pop_density']:,.0f}/km² | Comp: {top_locations.iloc[3]['competition_score']:.0f}
-Rank #5: Score {top_locations.iloc[4]['suitability_score_100']:.1f}/100 | Pop: {top_locations.iloc[4]['pop_density']:,.0f}/km² | Comp: {top_locations.iloc[4]['competition_score']:.0f}
-
-═══════════════════════════════════════════════════════════════
-
-📊 KEY STATISTICS
-
-Coverage: {stats['coverage_km2']:.1f} km² | {stats['total_cells']:,} cells analyzed
-Population: {stats['population']:,.0f} total
-Opportunities: {stats['underserved_cells']} underserved areas ({stats['underserved_pop']:,.0f} people)
-Competition: {stats['no_retail']:,} cells with NO retail presence
-
-═══════════════════════════════════════════════════════════════
-
-🗺️ USING THE INTERACTIVE MAP
+log_header("DOCUMENT 4: Quick Start Guide")
 
-1. Open: outputs/final/maps/georetail_interactive_map.html
-2. Click any cell for details
-3. Click numbered markers (1-20) for top locations
-4. Toggle layers (top-right) to show/hide data
-
-═══════════════════════════════════════════════════════════════
-
-💻 USING THE DASHBOARD
-
-1. Run: python dashboard_app.py
-2. Open: http://127.0.0.1:8050/
-3. Change map layers with dropdown
-4. Explore charts and tables
-
-═══════════════════════════════════════════════════════════════
-
-✅ NEXT STEPS
-
-Week 1: Review analysis & share with team
-Week 2: Field visit top 5 locations
-Week 3: Detailed feasibility for top 3
-Week 4: Make go/no-go decisions
-
-═══════════════════════════════════════════════════════════════
-
-📚 DOCUMENTATION
-
-Executive Summary: outputs/final/documentation/01_Executive_Summary.txt
-Full Methodology: outputs/final/documentation/02_Technical_Methodology.txt
-Detailed User Guide: outputs/final/documentation/03_User_Guide.txt
-
-═══════════════════════════════════════════════════════════════
-"""
+QUICK_START_TEMPLATE = load_template('quick_start')
 
 quick_start_file = "outputs/final/documentation/00_Quick_Start.txt"
-with open(quick_start_file, 'w') as f:
-    f.write(quick_start)
-
-print(f"✅ Quick Start Guide created: {quick_start_file}")
+submit_document('Quick Start Guide', quick_start_file, QUICK_START_TEMPLATE)
 
 # Create README for project
-print("\n" + "="*60)
-print("DOCUMENT 5: Project README")
-print("="*60)
-
-readme = f"""
-# GeoRetail - Coimbatore Retail Site Selection
-
-Data-driven retail location analysis using open-source geospatial data and multi-criteria decision analysis.
-
-## 📊 Project Overview
-
-**Analysis Date**: {datetime.now().strftime("%B %d, %Y")}
-**Study Area**: Coimbatore Municipal Corporation, Tamil Nadu, India
-**Coverage**: {stats['coverage_km2']:.1f} km² ({stats['total_cells']:,} grid cells)
-**Population Analyzed**: {stats['population']:,.0f}
-
-## 🎯 Key Results
-
-- **Top Suitability Score**: {stats['top_score']:.1f}/100
-- **Top 20 Locations Identified**
-- **{stats['underserved_cells']} Underserved Market Opportunities**
-- **{stats['no_retail']:,} Areas with Zero Competition**
-
-## 📁 Repository Structure
-
-```
-georetail_project/
-├── data/
-│   ├── coimbatore_boundary_clean.geojson
-│   └── processed/
-│       ├── coimbatore_population.tif
-│       ├── coimbatore_roads.geojson
-│       ├── amenities/
-│       │   ├── retail.geojson
-│       │   ├── education.geojson
-│       │   ├── healthcare.geojson
-│       │   └── banking.geojson
-│       └── grid/
-│           ├── analysis_grid_wgs84.geojson
-│           ├── top_20_locations.geojson
-│           └── underserved_areas.geojson
-│
-├── outputs/
-│   ├── final/
-│   │   ├── maps/
-│   │   │   └── georetail_interactive_map.html ⭐
-│   │   ├── documentation/
-│   │   │   ├── 00_Quick_Start.txt
-│   │   │   ├── 01_Executive_Summary.txt
-│   │   │   ├── 02_Technical_Methodology.txt
-│   │   │   └── 03_User_Guide.txt
-│   │   ├── top_20_locations.csv
-│   │   ├── suitability_analysis_final.png
-│   │   └── top_locations_criteria_analysis.png
-│   │
-│   ├── step2_population_analysis.png
-│   ├── step3_road_network_analysis.png
-│   ├── step4_amenities_poi_analysis.png
-│   └── step5_grid_features_analysis.png
-│
-├── dashboard_app.py
-└── README.md (this file)
-```
-
-## 🚀 Quick Start
-
-### View Interactive Map
-```bash
-# Open in browser
-open outputs/final/maps/georetail_interactive_map.html
-```
-
-### Run Dashboard
-```bash
-# Install dependencies
-pip install dash plotly geopandas pandas
-
-# Run dashboard
-python dashboard_app.py
-
-# Open browser to http://127.0.0.1:8050/
-```
-
-### View Results
-```bash
-# Top locations (spreadsheet)
-open outputs/final/top_20_locations.csv
-
-# Read documentation
-cat outputs/final/documentation/00_Quick_Start.txt
-```
-
-## 📋 Top 5 Recommended Locations
-
-1. **Rank #1** - Score: {top_locations.iloc[0]['suitability_score_100']:.1f}/100
-   - Population Density: {top_locations.iloc[0]['pop_density']:,.0f} people/km²
-   - Competition: {top_locations.iloc[0]['competition_score']:.0f} stores
-   - Rating: {top_locations.iloc[0]['suitability_class']}
-
-2. **Rank #2** - Score: {top_locations.iloc[1]['suitability_score_100']:.1f}/100
-   - Population Density: {top_locations.iloc[1]['pop_density']:,.0f} people/km²
-   - Competition: {top_locations.iloc[1]['competition_score']:.0f} stores
-   - Rating: {top_locations.iloc[1]['suitability_class']}
-
-3. **Rank #3** - Score: {top_locations.iloc[2]['suitability_score_100']:.1f}/100
-   - Population Density: {top_locations.iloc[2]['pop_density']:,.0f} people/km²
-   - Competition: {top_locations.iloc[2]['competition_score']:.0f} stores
-   - Rating: {top_locations.iloc[2]['suitability_class']}
-
-4. **Rank #4** - Score: {top_locations.iloc[3]['suitability_score_100']:.1f}/100
-   - Population Density: {top_locations.iloc[3]['pop_density']:,.0f} people/km²
-   - Competition: {top_locations.iloc[3]['competition_score']:.0f} stores
-   - Rating: {top_locations.iloc[3]['suitability_class']}
-
-5. **Rank #5** - Score: {top_locations.iloc[4]['suitability_score_100']:.1f}/100
-   - Population Density: {top_locations.iloc[4]['pop_density']:,.0f} people/km²
-   - Competition: {top_locations.iloc[4]['competition_score']:.0f} stores
-   - Rating: {top_locations.iloc[4]['suitability_class']}
-
-## 🛠️ Methodology
-
-### Data Sources (100% Free/Open)
-- **Population**: WorldPop 2020 (1km resolution)
-- **Roads**: OpenStreetMap via OSMnx
-- **POIs**: OpenStreetMap (retail, education, healthcare, banking)
-- **Boundaries**: Custom digitized
-
-### Analysis Framework
-- **Grid Size**: 500m × 500m cells
-- **Analysis Method**: Multi-Criteria Decision Analysis (MCDA)
-- **Criteria Weights**:
-  - Population Density: 30%
-  - Road Accessibility: 20%
-  - Competition Level: 15% (inverse)
-  - Amenity Proximity: 20%
-  - Economic Activity: 15%
-
-### Key Features Calculated
-- 27 features per grid cell
-- Population density and totals
-- Road network accessibility
-- Competition intensity
-- Amenity proximity scores
-- Economic activity indicators
+log_header("DOCUMENT 5: Project README")
 
-## 📚 Documentation
-
-- **Quick Start**: `outputs/final/documentation/00_Quick_Start.txt`
-- **Executive Summary**: `outputs/final/documentation/01_Executive_Summary.txt`
-- **Technical Methodology**: `outputs/final/documentation/02_Technical_Methodology.txt`
-- **User Guide**: `outputs/final/documentation/03_User_Guide.txt`
-
-## 🎨 Visualizations
-
-- Interactive HTML Map (Folium)
-- Web Dashboard (Plotly Dash)
-- Static Analysis Maps (PNG)
-- Charts and Graphs (PNG)
-
-## 💻 Requirements
-
-```
-python >= 3.7
-geopandas
-pandas
-numpy
-matplotlib
-rasterio
-osmnx
-folium
-dash
-plotly
-```
-
-## 📊 Key Statistics
-
-- **Grid Cells**: {stats['total_cells']:,}
-- **Coverage Area**: {stats['coverage_km2']:.1f} km²
-- **Population**: {stats['population']:,.0f}
-- **Mean Suitability**: {stats['mean_score']:.1f}/100
-- **Underserved Areas**: {stats['underserved_cells']}
-- **High Competition Cells**: {stats['high_competition']}
-- **Zero Retail Cells**: {stats['no_retail']:,}
-
-## 🎯 Next Steps
-
-1. **Week 1**: Review analysis and share with stakeholders
-2. **Week 2**: Field verification of top 5 locations
-3. **Week 3**: Detailed feasibility studies
-4. **Week 4**: Make go/no-go decisions
-
-## 📧 Support
-
-For questions or issues:
-- Review documentation in `outputs/final/documentation/`
-- Check methodology details
-- Verify data file locations
-
-## 📄 License
-
-This analysis uses open-source data and tools:
-- WorldPop: CC BY 4.0
-- OpenStreetMap: ODbL
-- Python libraries: Various open-source licenses
-
-## 🙏 Acknowledgments
-
-- WorldPop for population data
-- OpenStreetMap contributors for spatial data
-- OSMnx, GeoPandas, and other open-source projects
-
----
-
-**Generated**: {datetime.now().strftime("%B %d, %Y at %I:%M %p")}
-"""
+README_TEMPLATE = load_template('readme')
 
 readme_file = "README.md"
-with open(readme_file, 'w') as f:
-    f.write(readme)
+submit_document('Project README', readme_file, README_TEMPLATE)
 
-print(f"✅ Project README created: {readme_file}")
+for label, future in doc_futures.items():
+    log(f"✅ {label} created: {future.result()}")
+doc_writer.shutdown()
+Path(DOC_CACHE_FILE).write_text(json.dumps(doc_cache, indent=2), encoding='utf-8')
 
 # Final Summary
-print("\n" + "="*60)
-print("FINAL DOCUMENTATION PACKAGE COMPLETE!")
-print("="*60)
-
-summary = f"""
-╔═══════════════════════════════════════════════════════════════╗
-║          DOCUMENTATION PACKAGE SUCCESSFULLY CREATED!          ║
-╚═══════════════════════════════════════════════════════════════╝
-
-📚 DOCUMENTS CREATED:
-
-✅ outputs/final/documentation/00_Quick_Start.txt
-   → One-page reference guide
-
-✅ outputs/final/documentation/01_Executive_Summary.txt
-   → High-level overview for leadership
-
-✅ outputs/final/documentation/02_Technical_Methodology.txt
-   → Complete methodology and analysis details
-
-✅ outputs/final/documentation/03_User_Guide.txt
-   → Comprehensive how-to guide
-
-✅ README.md
-   → Project overview and quick reference
+log_header("FINAL DOCUMENTATION PACKAGE COMPLETE!")
 
-═══════════════════════════════════════════════════════════════
-
-📦 COMPLETE DELIVERABLES PACKAGE:
-
-DATA FILES:
-✅ Analysis grid ({stats['total_cells']:,} cells)
-✅ Top 20 locations
-✅ Underserved areas
-✅ All POI data
-
-INTERACTIVE TOOLS:
-✅ Folium HTML map
-✅ Plotly Dash dashboard
-✅ Real-time exploration
-
-VISUALIZATIONS:
-✅ Suitability maps
-✅ Analysis charts
-✅ Criteria breakdowns
-
-DOCUMENTATION:
-✅ Executive summary
-✅ Technical methodology
-✅ User guide
-✅ Quick start guide
-✅ Project README
-
-═══════════════════════════════════════════════════════════════
-
-🎯 YOU NOW HAVE EVERYTHING TO:
-
-✅ Present to stakeholders
-✅ Make data-driven decisions
-✅ Identify optimal retail locations
-✅ Plan market entry strategy
-✅ Support investment decisions
-✅ Scale to other cities
-
-═══════════════════════════════════════════════════════════════
-
-📋 RECOMMENDED READING ORDER:
-
-1. START HERE: 00_Quick_Start.txt (5 min)
-   → Get oriented quickly
-
-2. LEADERSHIP: 01_Executive_Summary.txt (15 min)
-   → Understand key findings and recommendations
-
-3. OPERATIONS: 03_User_Guide.txt (30 min)
-   → Learn how to use all tools
-
-4. TECHNICAL: 02_Technical_Methodology.txt (45 min)
-   → Deep dive into methodology
-
-═══════════════════════════════════════════════════════════════
-
-🚀 NEXT ACTIONS:
-
-IMMEDIATE:
-□ Review Quick Start Guide
-□ Open interactive map
-□ Share with team
-
-THIS WEEK:
-□ Present to stakeholders
-□ Get approval for field visits
-□ Plan verification trips
-
-NEXT WEEK:
-□ Visit top 5 locations
-□ Conduct surveys
-□ Refine selection
-
-═══════════════════════════════════════════════════════════════
-
-🎉 PROJECT COMPLETE!
-
-Your GeoRetail analysis is ready for:
-• Business decisions
-• Stakeholder presentations
-• Investment proposals
-• Market entry planning
-
-All files are in: outputs/final/
-
-═══════════════════════════════════════════════════════════════
-"""
+SUMMARY_TEMPLATE = load_template('project_complete')
 
-print(summary)
+summary = SUMMARY_TEMPLATE.format_map(ctx)
+log(summary)
 
 # Save final summary
 summary_file = "outputs/final/PROJECT_COMPLETE.txt"
-with open(summary_file, 'w') as f:
-    f.write(summary)
+write_document(summary_file, summary.encode('utf-8'))
 
-print(f"\n✅ Final summary saved: {summary_file}")
+log(f"\n✅ Final summary saved: {summary_file}")
 
-print("\n" + "="*60)
-print("🎉🎉🎉 ALL DOCUMENTATION COMPLETE! 🎉🎉🎉")
-print("="*60)
-print("\n🎯 Your GeoRetail project is 100% complete!")
-print("📁 All files ready in: outputs/final/")
-print("\n✨ Congratulations on completing the analysis! ✨")
\ No newline at end of file
+log_header("🎉🎉🎉 ALL DOCUMENTATION COMPLETE! 🎉🎉🎉")
+log("\n🎯 Your GeoRetail project is 100% complete!")
+log("📁 All files ready in: outputs/final/")
+log("\n✨ Congratulations on completing the analysis! ✨")
\ No newline at end of file
@@ -6,11 +6,27 @@ Create interactive HTML map with all analysis results
 import folium
 from folium import plugins
 import geopandas as gpd
+import pyogrio
 import pandas as pd
+import numpy as np
+import shapely
 import branca.colormap as cm
+from rasterio.features import rasterize
+from rasterio.transform import from_bounds
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import json
 import os
+import shutil
+import subprocess
+import sys
+
+# Vectorized GDAL/Arrow reads instead of Fiona's record-at-a-time loop.
+# Arrow hands back DATE fields as python date objects by default; keep them
+# as datetime64 so convert_datetime_columns_to_str still catches them.
+gpd.options.io_engine = "pyogrio"
+READ_KWARGS = dict(engine="pyogrio", use_arrow=True, arrow_to_pandas_kwargs={'date_as_object': False})
 
 print("""
 🎯 GEORETAIL PROJECT - STEP 7
@@ -21,11 +37,64 @@ print("""
 # Create output directory
 os.makedirs("outputs/final/maps", exist_ok=True)
 
+output_file = "outputs/final/maps/georetail_interactive_map.html"
+instructions_file = "outputs/final/maps/MAP_INSTRUCTIONS.txt"
+cache_key_file = "outputs/final/maps/.cachekey"
+grid_fgb_file = "outputs/final/maps/grid.fgb"
+grid_pmtiles_file = "outputs/final/maps/grid.pmtiles"
+
+boundary_file = "data/coimbatore_boundary_clean.geojson"
+
+poi_files = {
+    'retail': 'data/processed/amenities/retail.geojson',
+    'education': 'data/processed/amenities/education.geojson',
+    'healthcare': 'data/processed/amenities/healthcare.geojson',
+    'banking': 'data/processed/amenities/banking.geojson'
+}
+
+map_input_files = [
+    "data/processed/grid/analysis_grid_wgs84.geojson",
+    "data/processed/grid/top_20_locations.geojson",
+    "data/processed/grid/underserved_areas.geojson",
+    boundary_file,
+    *poi_files.values(),
+    __file__
+]
+
+def map_cache_key():
+    """Hash the map inputs and this script; missing optional inputs hash as empty"""
+    digest = hashlib.sha256()
+    for path in map_input_files:
+        digest.update(path.encode('utf-8'))
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            digest.update(b'<missing>')
+    return digest.hexdigest()
+
+# Rendering the map is the slow part; if nothing it is built from has
+# changed since the last run, reuse the existing HTML and instructions
+cache_key = map_cache_key()
+try:
+    with open(cache_key_file) as f:
+        cached_key = f.read().strip()
+except FileNotFoundError:
+    cached_key = None
+if (cached_key == cache_key and os.path.exists(output_file)
+        and os.path.exists(instructions_file)):
+    print("✅ Map inputs unchanged since last run, reusing existing map")
+    with open(instructions_file) as f:
+        print(f.read())
+    print(f"📂 Open this file in your browser:")
+    print(f"   {output_file}")
+    sys.exit(0)
+
 # Helper: Convert all datetime columns in a GeoDataFrame to string
 def convert_datetime_columns_to_str(gdf):
-    for col in gdf.columns:
-        if pd.api.types.is_datetime64_any_dtype(gdf[col]):
-            gdf[col] = gdf[col].astype(str)
+    dt_cols = gdf.select_dtypes(include=['datetime', 'datetimetz']).columns
+    if len(dt_cols):
+        gdf[dt_cols] = gdf[dt_cols].apply(lambda s: s.dt.strftime('%Y-%m-%d %H:%M:%S'))
     return gdf
 
 # Step 7.1: Load All Data
@@ -35,58 +104,69 @@ print("="*60)
 
 # Load grid with suitability scores
 print("Loading analysis grid...")
-grid_gdf = gpd.read_file("data/processed/grid/analysis_grid_wgs84.geojson")
+grid_gdf = gpd.read_file("data/processed/grid/analysis_grid_wgs84.geojson", **READ_KWARGS)
 grid_gdf = convert_datetime_columns_to_str(grid_gdf)
 print(f"✅ Grid loaded: {len(grid_gdf)} cells")
 
 # Load top locations
 print("Loading top locations...")
-top_locations = gpd.read_file("data/processed/grid/top_20_locations.geojson")
+top_locations = gpd.read_file("data/processed/grid/top_20_locations.geojson", **READ_KWARGS)
 top_locations = convert_datetime_columns_to_str(top_locations)
 print(f"✅ Top locations loaded: {len(top_locations)}")
 
 # Load underserved areas
 print("Loading underserved areas...")
 try:
-    underserved = gpd.read_file("data/processed/grid/underserved_areas.geojson")
+    underserved = gpd.read_file("data/processed/grid/underserved_areas.geojson", **READ_KWARGS)
     underserved = convert_datetime_columns_to_str(underserved)
     print(f"✅ Underserved areas loaded: {len(underserved)}")
 except:
     underserved = gpd.GeoDataFrame()
     print("⚠️  No underserved areas file found")
 
-# Load boundary
-print("Loading city boundary...")
-boundary_gdf = gpd.read_file("data/coimbatore_boundary_clean.geojson")
-boundary_gdf = convert_datetime_columns_to_str(boundary_gdf)
-print(f"✅ Boundary loaded")
-
-# Load POI data
-print("Loading POI data...")
-poi_files = {
-    'retail': 'data/processed/amenities/retail.geojson',
-    'education': 'data/processed/amenities/education.geojson',
-    'healthcare': 'data/processed/amenities/healthcare.geojson',
-    'banking': 'data/processed/amenities/banking.geojson'
-}
-
-poi_data = {}
-for name, file_path in poi_files.items():
-    try:
-        gdf = gpd.read_file(file_path)
-        gdf = convert_datetime_columns_to_str(gdf)
-        if len(gdf) > 0:
-            poi_data[name] = gdf
-            print(f"  ✅ {name}: {len(gdf)} locations")
-    except:
-        print(f"  ⚠️  {name}: Not found")
+def read_layer(path):
+    """Read one vector file through pyogrio's Arrow path"""
+    return convert_datetime_columns_to_str(gpd.read_file(path, **READ_KWARGS))
+
+# Load the boundary and POI files concurrently; GDAL releases the GIL while
+# reading, so the total is roughly the slowest file rather than the sum
+print("Loading city boundary and POI data...")
+with ThreadPoolExecutor(max_workers=len(poi_files) + 1) as executor:
+    boundary_future = executor.submit(read_layer, boundary_file)
+    poi_futures = {name: executor.submit(read_layer, file_path) for name, file_path in poi_files.items()}
+
+    boundary_gdf = boundary_future.result()
+    print(f"✅ Boundary loaded")
+
+    poi_data = {}
+    for name, future in poi_futures.items():
+        try:
+            gdf = future.result()
+            if len(gdf) > 0:
+                poi_data[name] = gdf
+                print(f"  ✅ {name}: {len(gdf)} locations")
+        except Exception:
+            print(f"  ⚠️  {name}: Not found")
+
+# Only emit features that fall inside the city (plus a 1 km margin), so
+# nothing outside the mapped area is written into the HTML
+CLIP_BUFFER_M = 1000
+clip_area = boundary_gdf.to_crs('EPSG:32643').buffer(CLIP_BUFFER_M).to_crs(boundary_gdf.crs).union_all()
+
+grid_gdf = grid_gdf[grid_gdf.intersects(clip_area)]
+if len(underserved) > 0:
+    underserved = underserved[underserved.intersects(clip_area)]
+for name, gdf in poi_data.items():
+    poi_data[name] = gdf[gdf.within(clip_area)]
+print(f"✅ Clipped to city boundary (+{CLIP_BUFFER_M} m): {len(grid_gdf)} cells, "
+      f"{sum(len(gdf) for gdf in poi_data.values())} POIs")
 
 # Helper to get suitability score column name
-def get_suitability_score(row):
+def find_score_column(gdf):
     for col in ['suitability_score_100', 'suitability_score', 'score']:
-        if col in row:
-            return row[col]
-    raise KeyError("No suitability score column found in row.")
+        if col in gdf.columns:
+            return col
+    return None
 
 # Step 7.2: Calculate Map Center
 print("\n" + "="*60)
@@ -122,79 +202,120 @@ colormap = cm.LinearColormap(
     caption='Suitability Score (0-100)'
 )
 
+# Vectorised equivalent of colormap(value): piecewise-linear blend of the
+# anchor colours per channel, truncated to bytes the same way branca does
+def colormap_rgba(values):
+    """Return an (n, 4) uint8 array of RGBA colours for an array of scores"""
+    anchors = np.asarray(colormap.colors)
+    rgba = np.column_stack([
+        np.interp(values, colormap.index, anchors[:, ch]) for ch in range(4)
+    ])
+    return (rgba * 255.9999).astype(np.uint8)
+
+# 256 evenly spaced colours across the score range; every raster pixel is
+# coloured by a table lookup instead of its own interpolation
+COLORMAP_LUT = colormap_rgba(np.linspace(colormap.vmin, colormap.vmax, 256))
+
+def colormap_lut_rgba(values):
+    """Look up RGBA colours for an array of scores in COLORMAP_LUT"""
+    position = (np.asarray(values) - colormap.vmin) / (colormap.vmax - colormap.vmin) * 255
+    return COLORMAP_LUT[np.clip(np.rint(position), 0, 255).astype(np.intp)]
+
+# Raster resolution for the suitability overlay, in pixels per grid cell side
+RASTER_PIXELS_PER_CELL = 10
+
+# Recommendation text indexed by how many of the 40/50/60 score cut-offs a
+# cell exceeds
+RECOMMENDATION_LABELS = np.array([
+    '⚠️ Lower priority area',
+    '🔍 Consider for specific strategy',
+    '✅ Good Opportunity',
+    '⭐ High Priority Location'
+], dtype=object)
+
 # Add suitability layer
 suitability_layer = folium.FeatureGroup(name='🎯 Suitability Score', show=True)
 
-for idx, row in grid_gdf.iterrows():
-    try:
-        score = get_suitability_score(row)
-    except KeyError:
-        print(f"⚠️  No suitability score found for cell {row.get('cell_id', idx)}. Skipping.")
-        continue
-    
-    # Create detailed popup
-    popup_html = f"""
-    <div style="font-family: Arial; width: 300px;">
-        <h4 style="margin-bottom: 10px; color: #1e40af; border-bottom: 2px solid #3b82f6; padding-bottom: 5px;">
-            Cell #{row['cell_id']}
-        </h4>
-        
-        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                    color: white; padding: 10px; border-radius: 5px; margin: 10px 0;">
-            <div style="font-size: 24px; font-weight: bold;">{score:.1f}/100</div>
-            <div style="font-size: 12px; opacity: 0.9;">{row.get('suitability_class', 'N/A')}</div>
-        </div>
-        
-        <table style="width: 100%; font-size: 12px; margin-top: 10px;">
-            <tr style="background: #f3f4f6;">
-                <td style="padding: 5px; font-weight: bold;">Population</td>
-                <td style="padding: 5px; text-align: right;">{row['population']:,.0f}</td>
-            </tr>
-            <tr>
-                <td style="padding: 5px; font-weight: bold;">Density</td>
-                <td style="padding: 5px; text-align: right;">{row['pop_density']:,.0f} /km²</td>
-            </tr>
-            <tr style="background: #f3f4f6;">
-                <td style="padding: 5px; font-weight: bold;">Competition</td>
-                <td style="padding: 5px; text-align: right; color: {'#dc2626' if row['competition_score'] > 10 else '#16a34a'};">
-                    {row['competition_score']:.0f} stores
-                </td>
-            </tr>
-            <tr>
-                <td style="padding: 5px; font-weight: bold;">Amenity Score</td>
-                <td style="padding: 5px; text-align: right;">{row['amenity_score']:.1f}</td>
-            </tr>
-            <tr style="background: #f3f4f6;">
-                <td style="padding: 5px; font-weight: bold;">Road Density</td>
-                <td style="padding: 5px; text-align: right;">{row['road_density_km_per_km2']:.1f} km/km²</td>
-            </tr>
-            <tr>
-                <td style="padding: 5px; font-weight: bold;">Highway Distance</td>
-                <td style="padding: 5px; text-align: right;">{row['dist_to_major_road_m']:.0f} m</td>
-            </tr>
-        </table>
-        
-        <div style="margin-top: 10px; padding: 8px; background: #fef3c7; border-left: 3px solid #f59e0b; font-size: 11px;">
-            <strong>💡 Recommendation:</strong><br>
-            {'⭐ High Priority Location' if score > 60 else 
-             '✅ Good Opportunity' if score > 50 else 
-             '🔍 Consider for specific strategy' if score > 40 else 
-             '⚠️ Lower priority area'}
-        </div>
-    </div>
-    """
-    
-    # Add polygon with color based on score
+score_col = find_score_column(grid_gdf)
+if score_col is None:
+    print("⚠️  No suitability score column found in grid. Skipping suitability layer.")
+else:
+    scores = grid_gdf[score_col].astype(float)
+    if 'suitability_class' in grid_gdf.columns:
+        suitability_class = grid_gdf['suitability_class'].astype(str)
+    else:
+        suitability_class = 'N/A'
+    score_values = scores.to_numpy()
+    recommendation_code = (score_values > 40).astype(np.int8) + (score_values > 50) + (score_values > 60)
+    recommendation = pd.Series(RECOMMENDATION_LABELS[recommendation_code], index=grid_gdf.index)
+
+    # Draw the scores as one image instead of 1,802 SVG polygons: burn each
+    # cell's score into a raster laid out in Web Mercator (what Leaflet
+    # draws), then colour it. Mercator x/y depend only on lon/lat, so the
+    # WGS84 extent is still the right overlay bounds.
+    grid_mercator = grid_gdf.geometry.to_crs(epsg=3857)
+    west, south, east, north = grid_mercator.total_bounds
+    cell_bounds = grid_mercator.bounds
+    pixel_size = float(np.median(cell_bounds['maxx'] - cell_bounds['minx'])) / RASTER_PIXELS_PER_CELL
+    width = int(np.ceil((east - west) / pixel_size))
+    height = int(np.ceil((north - south) / pixel_size))
+    score_raster = rasterize(
+        zip(grid_mercator.values, scores.to_numpy()),
+        out_shape=(height, width),
+        transform=from_bounds(west, south, east, north, width, height),
+        fill=np.nan,
+        dtype='float32'
+    )
+    has_score = ~np.isnan(score_raster)
+    score_image = np.zeros((height, width, 4), dtype=np.uint8)
+    score_image[has_score] = colormap_lut_rgba(score_raster[has_score])
+    lon_min, lat_min, lon_max, lat_max = grid_gdf.total_bounds
+    folium.raster_layers.ImageOverlay(
+        score_image,
+        bounds=[[lat_min, lon_min], [lat_max, lon_max]],
+        opacity=0.6
+    ).add_to(suitability_layer)
+
+    # Invisible cell polygons on top keep the per-cell tooltip and popup.
+    # Only the rounded values ship; Leaflet lays out the popup table.
+    grid_popup_columns = {
+        'cell_id': 'Cell',
+        score_col: 'Score',
+        'suitability_class': 'Class',
+        'population': 'Population',
+        'pop_density': 'Density (/km²)',
+        'competition_score': 'Competition (stores)',
+        'amenity_score': 'Amenity Score',
+        'road_density_km_per_km2': 'Road Density (km/km²)',
+        'dist_to_major_road_m': 'Highway Distance (m)',
+        'recommendation': '💡 Recommendation'
+    }
+    grid_layer_gdf = grid_gdf[['geometry', 'cell_id']].assign(**{
+        score_col: scores.round(1),
+        'suitability_class': suitability_class,
+        'population': grid_gdf['population'].round(0),
+        'pop_density': grid_gdf['pop_density'].round(0),
+        'competition_score': grid_gdf['competition_score'].round(0),
+        'amenity_score': grid_gdf['amenity_score'].round(1),
+        'road_density_km_per_km2': grid_gdf['road_density_km_per_km2'].round(1),
+        'dist_to_major_road_m': grid_gdf['dist_to_major_road_m'].round(0),
+        'recommendation': recommendation
+    })
     folium.GeoJson(
-        row.geometry,
-        style_function=lambda x, score=score: {
-            'fillColor': colormap(score),
+        grid_layer_gdf,
+        style_function=lambda x: {
             'color': 'gray',
-            'weight': 0.5,
-            'fillOpacity': 0.6
+            'weight': 0,
+            'fillOpacity': 0
         },
-        popup=folium.Popup(popup_html, max_width=350),
-        tooltip=f"Score: {score:.1f}"
+        popup=folium.GeoJsonPopup(
+            fields=list(grid_popup_columns),
+            aliases=list(grid_popup_columns.values()),
+            localize=True,
+            labels=True,
+            max_width=350
+        ),
+        tooltip=folium.GeoJsonTooltip(fields=[score_col], aliases=['Score'], localize=True)
     ).add_to(suitability_layer)
 
 suitability_layer.add_to(m)
@@ -206,116 +327,162 @@ print("\n" + "="*60)
 print("STEP 7.4: Adding Top 20 Locations")
 print("="*60)
 
-top_locations_layer = folium.FeatureGroup(name='🏆 Top 20 Locations', show=True)
-
-for idx, row in top_locations.iterrows():
-    centroid = row.geometry.centroid
-    rank = int(row['rank'])
-    
-    # Medal colors for top 3
-    if rank == 1:
-        icon_color = 'gold'
-        icon_symbol = '★'
-    elif rank == 2:
-        icon_color = 'silver'
-        icon_symbol = '★'
-    elif rank == 3:
-        icon_color = 'orange'
-        icon_symbol = '★'
-    else:
-        icon_color = 'blue'
-        icon_symbol = str(rank)
-    
-    # Detailed popup for top locations
-    try:
-        score = get_suitability_score(row)
-    except KeyError:
-        print(f"⚠️  No suitability score found for top location rank {rank}. Skipping.")
-        continue
-    
-    popup_html = f"""
+# Popup and marker HTML for the top locations, filled with str.format
+TOP_LOCATION_POPUP_TEMPLATE = """
     <div style="font-family: Arial; width: 320px;">
         <div style="background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%); 
                     color: white; padding: 15px; border-radius: 5px 5px 0 0; text-align: center;">
             <div style="font-size: 36px; font-weight: bold;">#{rank}</div>
             <div style="font-size: 14px; opacity: 0.9;">TOP RECOMMENDED LOCATION</div>
         </div>
-        
+    
         <div style="padding: 15px; background: white;">
             <div style="background: #e0f2fe; padding: 10px; border-radius: 5px; margin-bottom: 10px;">
                 <div style="font-size: 28px; font-weight: bold; color: #0369a1;">{score:.1f}/100</div>
-                <div style="font-size: 12px; color: #0c4a6e;">{row.get('suitability_class', 'N/A')}</div>
+                <div style="font-size: 12px; color: #0c4a6e;">{suitability_class}</div>
             </div>
-            
+        
             <table style="width: 100%; font-size: 13px;">
                 <tr style="background: #f9fafb;">
                     <td style="padding: 8px; font-weight: bold;">🏘️ Population</td>
-                    <td style="padding: 8px, text-align: right;">{row['population']:,.0f}</td>
+                    <td style="padding: 8px, text-align: right;">{population:,.0f}</td>
                 </tr>
                 <tr>
                     <td style="padding: 8px; font-weight: bold;">📊 Density</td>
                     <td style="padding: 8px; text-align: right; font-weight: bold; color: #16a34a;">
-                        {row['pop_density']:,.0f} /km²
+                        {density:,.0f} /km²
                     </td>
                 </tr>
                 <tr style="background: #f9fafb;">
                     <td style="padding: 8px; font-weight: bold;">🏪 Competition</td>
                     <td style="padding: 8px; text-align: right;">
-                        <span style="color: {'#dc2626' if row['competition_score'] > 20 else '#16a34a'}; font-weight: bold;">
-                            {row['competition_score']:.0f}
+                        <span style="color: {comp_color}; font-weight: bold;">
+                            {competition:.0f}
                         </span> stores
                     </td>
                 </tr>
                 <tr>
                     <td style="padding: 8px; font-weight: bold;">🎯 Amenities</td>
-                    <td style="padding: 8px; text-align: right;">{row['amenity_score']:.1f}</td>
+                    <td style="padding: 8px; text-align: right;">{amenity:.1f}</td>
                 </tr>
             </table>
-            
+        
             <div style="margin-top: 15px; padding: 12px; background: #dcfce7; 
                         border-left: 4px solid #16a34a; border-radius: 3px;">
                 <div style="font-weight: bold; color: #166534; margin-bottom: 5px;">✅ WHY THIS LOCATION?</div>
                 <ul style="margin: 5px 0; padding-left: 20px; font-size: 12px; color: #166534;">
-                    <li>{'Extremely high' if row['pop_density'] > 60000 else 'High'} population density</li>
-                    <li>{'Zero' if row['competition_score'] == 0 else 'Low' if row['competition_score'] < 10 else 'Moderate'} competition</li>
-                    <li>{'Strong' if row['amenity_score'] > 10 else 'Good'} foot traffic potential</li>
+                    <li>{density_label} population density</li>
+                    <li>{competition_label} competition</li>
+                    <li>{traffic_label} foot traffic potential</li>
                 </ul>
             </div>
-            
+        
             <div style="margin-top: 10px; padding: 10px; background: #fef3c7; 
                         border-radius: 3px; text-align: center;">
                 <div style="font-weight: bold; color: #92400e; font-size: 13px;">
-                    {'🚀 IMMEDIATE PRIORITY' if rank <= 5 else '⭐ STRONG CANDIDATE'}
+                    {priority_label}
                 </div>
             </div>
         </div>
     </div>
-    """
-    
-    # Add marker
-    folium.Marker(
-        location=[centroid.y, centroid.x],
-        popup=folium.Popup(popup_html, max_width=350),
-        icon=folium.DivIcon(html=f"""
-            <div style="
-                font-size: 16px; 
-                font-weight: bold; 
-                color: white; 
-                background: {'linear-gradient(135deg, #fbbf24, #f59e0b)' if rank <= 3 else 'linear-gradient(135deg, #3b82f6, #1d4ed8)'};
-                width: 35px; 
-                height: 35px; 
-                border-radius: 50%; 
-                display: flex; 
-                align-items: center; 
-                justify-content: center;
-                border: 3px solid white;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.3);
-            ">
-                {rank}
-            </div>
-        """),
-        tooltip=f"Rank #{rank} - Score: {score:.1f}"
-    ).add_to(top_locations_layer)
+"""
+
+TOP_LOCATION_ICON_TEMPLATE = """
+    <div style="
+        font-size: 16px; 
+        font-weight: bold; 
+        color: white; 
+        background: {background};
+        width: 35px; 
+        height: 35px; 
+        border-radius: 50%; 
+        display: flex; 
+        align-items: center; 
+        justify-content: center;
+        border: 3px solid white;
+        box-shadow: 0 2px 5px rgba(0,0,0,0.3);
+    ">
+        {rank}
+    </div>
+"""
+
+# Label tables for the top locations, indexed by integer codes computed
+# column-wise from the thresholds below
+COMPETITION_COLORS = np.array(['#16a34a', '#dc2626'], dtype=object)  # > 20 stores
+DENSITY_LABELS = np.array(['High', 'Extremely high'], dtype=object)  # > 60,000 /km²
+COMPETITION_LABELS = np.array(['Zero', 'Low', 'Moderate'], dtype=object)  # 0, < 10, >= 10
+TRAFFIC_LABELS = np.array(['Good', 'Strong'], dtype=object)  # amenity score > 10
+PRIORITY_LABELS = np.array(['⭐ STRONG CANDIDATE', '🚀 IMMEDIATE PRIORITY'], dtype=object)  # rank <= 5
+ICON_BACKGROUNDS = np.array([
+    'linear-gradient(135deg, #3b82f6, #1d4ed8)',
+    'linear-gradient(135deg, #fbbf24, #f59e0b)'  # rank <= 3
+], dtype=object)
+
+top_locations_layer = folium.FeatureGroup(name='🏆 Top 20 Locations', show=True)
+
+top_score_col = find_score_column(top_locations)
+if top_score_col is None:
+    print("⚠️  No suitability score column found in top locations. Skipping markers.")
+else:
+    if 'suitability_class' in top_locations.columns:
+        top_classes = top_locations['suitability_class'].to_numpy()
+    else:
+        top_classes = np.full(len(top_locations), 'N/A', dtype=object)
+    # All centroid coordinates in vectorised GEOS calls rather than one per marker
+    centroids = shapely.centroid(top_locations.geometry.values)
+    cx = shapely.get_x(centroids)
+    cy = shapely.get_y(centroids)
+
+    ranks = top_locations['rank'].astype(int).to_numpy()
+    top_scores = top_locations[top_score_col].to_numpy()
+    populations = top_locations['population'].to_numpy()
+    densities = top_locations['pop_density'].to_numpy()
+    competitions = top_locations['competition_score'].to_numpy()
+    amenities = top_locations['amenity_score'].to_numpy()
+
+    # Detailed popup for top locations
+    top_popups = [
+        TOP_LOCATION_POPUP_TEMPLATE.format(
+            rank=rank,
+            score=score,
+            suitability_class=suitability_class,
+            population=population,
+            density=density,
+            competition=competition,
+            amenity=amenity,
+            comp_color=comp_color,
+            density_label=density_label,
+            competition_label=competition_label,
+            traffic_label=traffic_label,
+            priority_label=priority_label
+        )
+        for (rank, score, suitability_class, population, density, competition, amenity,
+             comp_color, density_label, competition_label, traffic_label, priority_label) in zip(
+            ranks,
+            top_scores,
+            top_classes,
+            populations,
+            densities,
+            competitions,
+            amenities,
+            COMPETITION_COLORS[(competitions > 20).astype(np.int8)],
+            DENSITY_LABELS[(densities > 60000).astype(np.int8)],
+            COMPETITION_LABELS[(competitions > 0).astype(np.int8) + (competitions >= 10)],
+            TRAFFIC_LABELS[(amenities > 10).astype(np.int8)],
+            PRIORITY_LABELS[(ranks <= 5).astype(np.int8)]
+        )
+    ]
+    icon_backgrounds = ICON_BACKGROUNDS[(ranks <= 3).astype(np.int8)]
+
+    for lat, lon, rank, score, popup_html, background in zip(
+        cy, cx, ranks, top_scores, top_popups, icon_backgrounds
+    ):
+        folium.Marker(
+            location=[lat, lon],
+            popup=folium.Popup(popup_html, max_width=350),
+            icon=folium.DivIcon(html=TOP_LOCATION_ICON_TEMPLATE.format(rank=rank, background=background)),
+            tooltip=f"Rank #{rank} - Score: {score:.1f}"
+        ).add_to(top_locations_layer)
 
 top_locations_layer.add_to(m)
 print(f"✅ Added {len(top_locations)} top location markers")
@@ -328,49 +495,46 @@ if len(underserved) > 0:
     
     underserved_layer = folium.FeatureGroup(name='🎯 Underserved Markets', show=False)
     
-    for idx, row in underserved.iterrows():
-        popup_html = f"""
-        <div style="font-family: Arial; width: 280px;">
-            <div style="background: linear-gradient(135deg, #10b981 0%, #059669 100%); 
-                        color: white; padding: 10px; border-radius: 5px 5px 0 0;">
-                <h4 style="margin: 0;">🎯 Market Opportunity</h4>
-            </div>
-            <div style="padding: 10px; background: white;">
-                <table style="width: 100%; font-size: 12px;">
-                    <tr style="background: #f3f4f6;">
-                        <td style="padding: 5px;">Population</td>
-                        <td style="padding: 5px; text-align: right; font-weight: bold;">{row['population']:,.0f}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 5px;">Competition</td>
-                        <td style="padding: 5px; text-align: right; color: #16a34a; font-weight: bold;">
-                            {row['competition_score']:.0f} (LOW!)
-                        </td>
-                    </tr>
-                    <tr style="background: #f3f4f6;">
-                        <td style="padding: 5px;">Market Gap Score</td>
-                        <td style="padding: 5px; text-align: right; font-weight: bold;">{row['market_gap_score']:.1f}</td>
-                    </tr>
-                </table>
-                <div style="margin-top: 10px; padding: 8px; background: #d1fae5; 
-                            border-left: 3px solid #10b981; font-size: 11px;">
-                    <strong>💡 Opportunity:</strong> Underserved area with good population but minimal competition
-                </div>
-            </div>
-        </div>
-        """
-        
-        folium.GeoJson(
-            row.geometry,
-            style_function=lambda x: {
-                'fillColor': '#10b981',
-                'color': '#059669',
-                'weight': 2,
-                'fillOpacity': 0.5
-            },
-            popup=folium.Popup(popup_html, max_width=300),
-            tooltip="Underserved Market"
-        ).add_to(underserved_layer)
+    underserved_popups = (
+        '<div style="font-family: Arial; width: 280px;">'
+        '<div style="background: linear-gradient(135deg, #10b981 0%, #059669 100%); '
+        'color: white; padding: 10px; border-radius: 5px 5px 0 0;">'
+        '<h4 style="margin: 0;">🎯 Market Opportunity</h4>'
+        '</div>'
+        '<div style="padding: 10px; background: white;">'
+        '<table style="width: 100%; font-size: 12px;">'
+        '<tr style="background: #f3f4f6;">'
+        '<td style="padding: 5px;">Population</td>'
+        '<td style="padding: 5px; text-align: right; font-weight: bold;">'
+        + underserved['population'].map('{:,.0f}'.format) + '</td>'
+        '</tr><tr>'
+        '<td style="padding: 5px;">Competition</td>'
+        '<td style="padding: 5px; text-align: right; color: #16a34a; font-weight: bold;">'
+        + underserved['competition_score'].map('{:.0f}'.format) + ' (LOW!)</td>'
+        '</tr><tr style="background: #f3f4f6;">'
+        '<td style="padding: 5px;">Market Gap Score</td>'
+        '<td style="padding: 5px; text-align: right; font-weight: bold;">'
+        + underserved['market_gap_score'].map('{:.1f}'.format) + '</td>'
+        '</tr></table>'
+        '<div style="margin-top: 10px; padding: 8px; background: #d1fae5; '
+        'border-left: 3px solid #10b981; font-size: 11px;">'
+        '<strong>💡 Opportunity:</strong> Underserved area with good population but minimal competition'
+        '</div>'
+        '</div>'
+        '</div>'
+    )
+
+    folium.GeoJson(
+        underserved[['geometry']].assign(_popup_html=underserved_popups),
+        style_function=lambda x: {
+            'fillColor': '#10b981',
+            'color': '#059669',
+            'weight': 2,
+            'fillOpacity': 0.5
+        },
+        popup=folium.GeoJsonPopup(fields=['_popup_html'], labels=False, max_width=300),
+        tooltip="Underserved Market"
+    ).add_to(underserved_layer)
     
     underserved_layer.add_to(m)
     print(f"✅ Added {len(underserved)} underserved areas")
@@ -387,17 +551,20 @@ poi_configs = {
     'banking': {'color': 'orange', 'icon': 'dollar', 'name': '🏦 Banking'}
 }
 
-for poi_type, config in poi_configs.items():
-    if poi_type in poi_data:
-        poi_layer = folium.FeatureGroup(name=config['name'], show=False)
-        
-        # Sample POIs if too many (for performance)
-        poi_gdf = poi_data[poi_type]
-        if len(poi_gdf) > 100:
-            poi_gdf = poi_gdf.sample(n=100)
-        
-        for idx, row in poi_gdf.iterrows():
-            popup_text = f"""
+# Every POI is kept; Leaflet.markercluster groups them in the browser per
+# zoom level, and each type ships as one coordinate array
+POI_MARKER_CALLBACK = """function (row) {{
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {{
+        radius: 4, color: {color}, fill: true, fillColor: {color}, fillOpacity: 0.7
+    }});
+    marker.bindTooltip({tooltip});
+    marker.bindPopup({popup}, {{maxWidth: 200}});
+    return marker;
+}}"""
+
+def build_poi_layer(poi_type, config, poi_gdf):
+    """Build one POI type's marker cluster layer, detached from the map"""
+    popup_text = f"""
             <div style="font-family: Arial;">
                 <h4 style="color: {config['color']};">{config['name']}</h4>
                 <p style="font-size: 12px;">
@@ -406,20 +573,29 @@ for poi_type, config in poi_configs.items():
                 </p>
             </div>
             """
-            
-            folium.CircleMarker(
-                location=[row.geometry.y, row.geometry.x],
-                radius=4,
-                popup=folium.Popup(popup_text, max_width=200),
-                color=config['color'],
-                fill=True,
-                fillColor=config['color'],
-                fillOpacity=0.7,
-                tooltip=poi_type.title()
-            ).add_to(poi_layer)
-        
-        poi_layer.add_to(m)
-        print(f"  ✅ {poi_type}: {len(poi_gdf)} locations")
+    return plugins.FastMarkerCluster(
+        np.column_stack([poi_gdf.geometry.y.to_numpy(), poi_gdf.geometry.x.to_numpy()]).tolist(),
+        callback=POI_MARKER_CALLBACK.format(
+            color=json.dumps(config['color']),
+            tooltip=json.dumps(poi_type.title()),
+            popup=json.dumps(popup_text)
+        ),
+        name=config['name'],
+        show=False
+    )
+
+# The layers are independent, so build them in parallel; the map itself is
+# not thread-safe, so they are attached one by one afterwards
+poi_types = [poi_type for poi_type in poi_configs if poi_type in poi_data]
+with ThreadPoolExecutor(max_workers=4) as executor:
+    poi_layers = list(executor.map(
+        lambda poi_type: build_poi_layer(poi_type, poi_configs[poi_type], poi_data[poi_type]),
+        poi_types
+    ))
+
+for poi_type, poi_layer in zip(poi_types, poi_layers):
+    poi_layer.add_to(m)
+    print(f"  ✅ {poi_type}: {len(poi_data[poi_type])} locations")
 
 # Step 7.7: Add City Boundary
 print("\n" + "="*60)
@@ -502,8 +678,13 @@ print("\n" + "="*60)
 print("STEP 7.9: Saving Interactive Map")
 print("="*60)
 
-output_file = "outputs/final/maps/georetail_interactive_map.html"
-m.save(output_file)
+# Same as m.save(), but the root template is streamed to the file chunk by
+# chunk instead of first being rendered into one multi-megabyte string
+root = m.get_root()
+for child in root._children.values():
+    child.render()
+with open(output_file, 'w', encoding='utf-8', newline='') as f:
+    root._template.stream(this=root, kwargs={}).dump(f)
 
 print(f"✅ Interactive map saved: {output_file}")
 
@@ -511,6 +692,20 @@ print(f"✅ Interactive map saved: {output_file}")
 file_size = os.path.getsize(output_file) / (1024 * 1024)  # MB
 print(f"   File size: {file_size:.2f} MB")
 
+# Export the grid as FlatGeobuf (and PMTiles when tippecanoe is installed)
+# for serving as vector tiles. The HTML above keeps its layers inline so it
+# still opens standalone: tiles need an HTTP server for range requests.
+pyogrio.write_dataframe(grid_gdf, grid_fgb_file, driver="FlatGeobuf")
+print(f"✅ Grid exported: {grid_fgb_file}")
+if shutil.which("tippecanoe"):
+    subprocess.run(
+        ["tippecanoe", "-o", grid_pmtiles_file, "-z14", "-l", "grid", "--force", grid_fgb_file],
+        check=True
+    )
+    print(f"✅ Vector tiles built: {grid_pmtiles_file}")
+else:
+    print("⚠️  tippecanoe not found, skipping PMTiles build")
+
 # Step 7.10: Create Summary
 print("\n" + "="*60)
 print("STEP 7.10: Map Summary")
@@ -592,10 +787,12 @@ Step 5: Enable POI layers to understand competition
 print(summary)
 
 # Save instructions
-instructions_file = "outputs/final/maps/MAP_INSTRUCTIONS.txt"
 with open(instructions_file, 'w') as f:
     f.write(summary)
 
+with open(cache_key_file, 'w') as f:
+    f.write(cache_key)
+
 print(f"✅ Instructions saved: {instructions_file}")
 
 print("\n" + "="*60)
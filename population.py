@@ -5,12 +5,24 @@ Collect and process population data for Coimbatore city
 
 import rasterio
 from rasterio.mask import mask
+from rasterio.plot import show
 import geopandas as gpd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
 import os
+import shutil
+import sys
+import time
+from functools import lru_cache
+from _boundary_meta import BOUNDARY_FILE, load_boundary_meta
+
+# Headless batch runs can skip the figures with --no-plot or GEORETAIL_NOPLOT=1
+NO_PLOT = '--no-plot' in sys.argv or bool(os.environ.get('GEORETAIL_NOPLOT'))
 
 print("""
 🎯 GEORETAIL PROJECT - STEP 2
@@ -25,8 +37,17 @@ os.makedirs("outputs", exist_ok=True)
 
 # Load Coimbatore boundary
 print("Loading Coimbatore boundary...")
-boundary_gdf = gpd.read_file("data/coimbatore_boundary_clean.geojson")
-print(f"✅ Boundary loaded: {boundary_gdf.geometry.area.sum()/1e6:.2f} km²")
+boundary_gdf = gpd.read_file(BOUNDARY_FILE)
+boundary_meta = load_boundary_meta(boundary_gdf)
+print(f"✅ Boundary loaded: {boundary_meta['area_km2']:.2f} km²")
+
+# Reproject the boundary at most once per target CRS; the clip, the plot
+# overlay and the report each ask for it
+@lru_cache(maxsize=None)
+def boundary_in_crs(crs):
+    if boundary_gdf.crs == crs:
+        return boundary_gdf
+    return boundary_gdf.to_crs(crs)
 
 # Step 2.1: Download WorldPop Data
 print("\n" + "="*60)
@@ -36,6 +57,24 @@ print("="*60)
 worldpop_url_india = "https://data.worldpop.org/GIS/Population/Global_2000_2020_1km/2020/IND/ind_ppp_2020_1km_Aggregated.tif"
 
 worldpop_file = "data/worldpop_india_2020.tif"
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+class ProgressReader:
+    """Read-through wrapper that prints throttled download progress"""
+    def __init__(self, raw, total_size):
+        self.raw = raw
+        self.total_size = total_size
+        self.downloaded = 0
+        self.last_print = time.monotonic()
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.downloaded += len(data)
+        now = time.monotonic()
+        if self.total_size > 0 and (not data or now - self.last_print > 0.5):
+            self.last_print = now
+            print(f"\rProgress: {(self.downloaded / self.total_size) * 100:.1f}%", end="")
+        return data
 
 if not os.path.exists(worldpop_file):
     print(f"📥 Downloading WorldPop data for India...")
@@ -43,18 +82,17 @@ if not os.path.exists(worldpop_file):
     print("⚠️  This file is ~500MB, may take several minutes...")
     
     try:
-        response = requests.get(worldpop_url_india, stream=True)
-        total_size = int(response.headers.get('content-length', 0))
-        
-        with open(worldpop_file, 'wb') as f:
-            downloaded = 0
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        print(f"\rProgress: {percent:.1f}%", end="")
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        with session.get(worldpop_url_india, stream=True, timeout=(5, 60)) as response:
+            total_size = int(response.headers.get('content-length', 0))
+            response.raw.decode_content = True
+            
+            # Copy the socket to disk in 1 MiB reads inside shutil; progress
+            # is printed at most twice a second
+            with open(worldpop_file, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                shutil.copyfileobj(ProgressReader(response.raw, total_size), f,
+                                   length=DOWNLOAD_CHUNK_SIZE)
         
         print("\n✅ Download complete!")
     except Exception as e:
@@ -84,9 +122,7 @@ if not os.path.exists(output_file):
         # Reproject boundary to match raster CRS if needed
         if boundary_gdf.crs != src.crs:
             print(f"Reprojecting boundary from {boundary_gdf.crs} to {src.crs}")
-            boundary_gdf_proj = boundary_gdf.to_crs(src.crs)
-        else:
-            boundary_gdf_proj = boundary_gdf
+        boundary_gdf_proj = boundary_in_crs(src.crs)
         
         # Clip raster
         out_image, out_transform = mask(
@@ -102,7 +138,15 @@ if not os.path.exists(output_file):
             "height": out_image.shape[1],
             "width": out_image.shape[2],
             "transform": out_transform,
-            "compress": "lzw"
+            # 256x256 deflate tiles; the predictor is picked from the band
+            # dtype since horizontal differencing (2) only suits integers
+            "tiled": True,
+            "blockxsize": 256,
+            "blockysize": 256,
+            "compress": "deflate",
+            "predictor": 3 if np.issubdtype(out_image.dtype, np.floating) else 2,
+            "num_threads": "all_cpus",
+            "BIGTIFF": "IF_SAFER"
         })
         
         # Save clipped raster
@@ -119,59 +163,77 @@ print("\n" + "="*60)
 print("STEP 2.3: Population Statistics")
 print("="*60)
 
-with rasterio.open(output_file) as src:
-    pop_data = src.read(1)
-    
-    # Remove nodata values
-    pop_data_valid = pop_data[pop_data > 0]
-    
-    total_population = pop_data_valid.sum()
-    mean_density = pop_data_valid.mean()
-    max_density = pop_data_valid.max()
-    
-    print(f"📊 Population Statistics:")
-    print(f"Total Population: {total_population:,.0f}")
-    print(f"Mean Density: {mean_density:.2f} people/pixel")
-    print(f"Max Density: {max_density:.2f} people/pixel")
-    print(f"Pixel Resolution: ~{src.res[0]*111:.0f}m × {src.res[1]*111:.0f}m")
+# Read and decode the clipped raster once; statistics, plots and the report
+# all reuse this array and metadata
+def load_population_raster(path):
+    with rasterio.Env(GDAL_CACHEMAX=512, GDAL_NUM_THREADS='ALL_CPUS', VSI_CACHE=True):
+        with rasterio.open(path) as src:
+            pop_data = np.empty(src.shape, dtype=src.dtypes[0])
+            src.read(1, out=pop_data)
+            return pop_data, src.transform, src.res, src.crs, src.nodata
+
+pop_data, pop_transform, pop_res, pop_crs, pop_nodata = load_population_raster(output_file)
+
+# Reduce over populated pixels in place with a mask, instead of first
+# compacting them into a copy (nodata and empty pixels are <= 0)
+valid_mask = pop_data > 0
+valid_count = np.count_nonzero(valid_mask)
+
+total_population = pop_data.sum(where=valid_mask, dtype=np.float64)
+mean_density = total_population / valid_count
+max_density = pop_data.max(where=valid_mask, initial=-np.inf)
+min_density = pop_data.min(where=valid_mask, initial=np.inf)
+std_density = pop_data.std(where=valid_mask, dtype=np.float64)
+
+print(f"📊 Population Statistics:")
+print(f"Total Population: {total_population:,.0f}")
+print(f"Mean Density: {mean_density:.2f} people/pixel")
+print(f"Max Density: {max_density:.2f} people/pixel")
+print(f"Pixel Resolution: ~{pop_res[0]*111:.0f}m × {pop_res[1]*111:.0f}m")
 
 # Step 2.4: Visualize Population Data
 print("\n" + "="*60)
 print("STEP 2.4: Creating Visualizations")
 print("="*60)
 
-fig, axes = plt.subplots(2, 2, figsize=(16, 14))
+output_viz = "outputs/step2_population_analysis.png"
+
+def render_plots():
+    fig, axes = plt.subplots(2, 2, figsize=(16, 14))
 
-# Plot 1: Population Density Map
-with rasterio.open(output_file) as src:
-    pop_data = src.read(1)
-    pop_data_masked = np.ma.masked_where(pop_data <= 0, pop_data)
-    
-    im1 = axes[0, 0].imshow(pop_data_masked, cmap='YlOrRd', interpolation='nearest')
+    # Plot 1: Population Density Map
+    # Empty pixels as NaN (drawn transparent, like masked values) rather than
+    # a MaskedArray, so matplotlib colour-maps one plain float32 buffer
+    pop_data_display = np.where(valid_mask, pop_data, np.float32(np.nan))
+
+    im1 = axes[0, 0].imshow(pop_data_display, cmap='YlOrRd', interpolation='nearest')
     axes[0, 0].set_title('Population Density - Coimbatore', fontsize=14, fontweight='bold')
     plt.colorbar(im1, ax=axes[0, 0], label='People per pixel')
     axes[0, 0].axis('off')
 
-# Plot 2: Population Density with Boundary Overlay
-with rasterio.open(output_file) as src:
-    from rasterio.plot import show
-    show(src, ax=axes[0, 1], cmap='YlOrRd', title='Population with City Boundary')
-    
+    # Plot 2: Population Density with Boundary Overlay
+    # (nodata masked, as rasterio.plot.show does when given the open dataset)
+    show(np.ma.masked_equal(pop_data, pop_nodata), transform=pop_transform,
+         ax=axes[0, 1], cmap='YlOrRd', title='Population with City Boundary')
+
     # Overlay boundary
-    boundary_gdf_plot = boundary_gdf.to_crs(src.crs)
+    boundary_gdf_plot = boundary_in_crs(pop_crs)
     boundary_gdf_plot.boundary.plot(ax=axes[0, 1], color='blue', linewidth=2)
     axes[0, 1].set_title('Population Density with Boundary', fontsize=14, fontweight='bold')
 
-# Plot 3: Population Distribution Histogram
-axes[1, 0].hist(pop_data_valid, bins=50, color='steelblue', edgecolor='black', alpha=0.7)
-axes[1, 0].set_xlabel('Population per pixel', fontsize=12)
-axes[1, 0].set_ylabel('Frequency', fontsize=12)
-axes[1, 0].set_title('Population Distribution', fontsize=14, fontweight='bold')
-axes[1, 0].grid(True, alpha=0.3)
-
-# Plot 4: Statistics Summary
-axes[1, 1].axis('off')
-stats_text = f"""
+    # Plot 3: Population Distribution Histogram
+    # Bin once with numpy, then draw the counts; same bars as plt.hist
+    hist_counts, hist_edges = np.histogram(pop_data[valid_mask], bins=50)
+    axes[1, 0].bar(hist_edges[:-1], hist_counts, width=np.diff(hist_edges), align='edge',
+                   color='steelblue', edgecolor='black', alpha=0.7)
+    axes[1, 0].set_xlabel('Population per pixel', fontsize=12)
+    axes[1, 0].set_ylabel('Frequency', fontsize=12)
+    axes[1, 0].set_title('Population Distribution', fontsize=14, fontweight='bold')
+    axes[1, 0].grid(True, alpha=0.3)
+
+    # Plot 4: Statistics Summary
+    axes[1, 1].axis('off')
+    stats_text = f"""
 POPULATION DATA SUMMARY
 
 📊 Total Population: {total_population:,.0f}
@@ -179,28 +241,32 @@ POPULATION DATA SUMMARY
 📈 Density Statistics:
    Mean: {mean_density:.2f} people/pixel
    Max: {max_density:.2f} people/pixel
-   Min: {pop_data_valid.min():.2f} people/pixel
-   Std Dev: {pop_data_valid.std():.2f}
+   Min: {min_density:.2f} people/pixel
+   Std Dev: {std_density:.2f}
 
 📐 Data Resolution:
-   Pixel size: ~{src.res[0]*111:.0f}m × {src.res[1]*111:.0f}m
+   Pixel size: ~{pop_res[0]*111:.0f}m × {pop_res[1]*111:.0f}m
    Grid cells: {pop_data.shape[0]} × {pop_data.shape[1]}
 
 ✅ Data Source: WorldPop 2020
 ✅ Coverage: Coimbatore Municipal Corporation
 """
 
-axes[1, 1].text(0.1, 0.5, stats_text, fontsize=11, family='monospace',
-               verticalalignment='center',
-               bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8))
+    axes[1, 1].text(0.1, 0.5, stats_text, fontsize=11, family='monospace',
+                   verticalalignment='center',
+                   bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8))
 
-plt.suptitle('Coimbatore Population Analysis - GeoRetail Project', 
-            fontsize=16, fontweight='bold', y=0.98)
-plt.tight_layout()
+    plt.suptitle('Coimbatore Population Analysis - GeoRetail Project', 
+                fontsize=16, fontweight='bold', y=0.98)
+    plt.tight_layout()
 
-output_viz = "outputs/step2_population_analysis.png"
-plt.savefig(output_viz, dpi=300, bbox_inches='tight')
-print(f"✅ Visualization saved: {output_viz}")
+    plt.savefig(output_viz, dpi=300, bbox_inches='tight')
+
+if NO_PLOT:
+    print("⏭️  Plots skipped (--no-plot / GEORETAIL_NOPLOT)")
+else:
+    render_plots()
+    print(f"✅ Visualization saved: {output_viz}")
 
 # Step 2.5: Save Summary Report
 print("\n" + "="*60)
@@ -222,13 +288,13 @@ Date: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 Population Density:
 - Mean: {mean_density:.2f} people/pixel
 - Maximum: {max_density:.2f} people/pixel
-- Minimum: {pop_data_valid.min():.2f} people/pixel
-- Standard Deviation: {pop_data_valid.std():.2f}
+- Minimum: {min_density:.2f} people/pixel
+- Standard Deviation: {std_density:.2f}
 
 Spatial Coverage:
 - Raster dimensions: {pop_data.shape[0]} × {pop_data.shape[1]} pixels
-- Pixel resolution: ~{src.res[0]*111:.0f}m × {src.res[1]*111:.0f}m
-- Total area covered: {boundary_gdf.to_crs('EPSG:3857').geometry.area.sum()/1e6:.2f} km²
+- Pixel resolution: ~{pop_res[0]*111:.0f}m × {pop_res[1]*111:.0f}m
+- Total area covered: {boundary_meta['area_km2']:.2f} km²
 
 === OUTPUT FILES ===
 
@@ -259,9 +325,4 @@ print("\n📋 FILES CREATED:")
 print(f"   1. {output_file}")
 print(f"   2. {output_viz}")
 print(f"   3. {report_file}")
-print("\n➡️  NEXT: Run Step 3 - Road Network Collection")
-
-try:
-    plt.show()
-except:
-    print("⚠️  Display not available (headless mode)")
\ No newline at end of file
+print("\n➡️  NEXT: Run Step 3 - Road Network Collection")
\ No newline at end of file
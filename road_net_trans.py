@@ -5,14 +5,35 @@ Collect and process road networks and transportation infrastructure for Coimbato
 
 import osmnx as ox
 import geopandas as gpd
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import networkx as nx
+from matplotlib.colors import ListedColormap
+from matplotlib.lines import Line2D
 import numpy as np
+import shapely
+from shapely import STRtree
+from pyproj import Geod
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import os
+import sys
 import warnings
+from _boundary_meta import BOUNDARY_FILE, load_boundary_meta
 warnings.filterwarnings('ignore')
 
+# Headless batch runs can skip the figures with --no-plot or GEORETAIL_NOPLOT=1
+NO_PLOT = '--no-plot' in sys.argv or bool(os.environ.get('GEORETAIL_NOPLOT'))
+
+# Let Agg simplify and chunk long line paths when the figures are drawn
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# Reuse cached Overpass responses on re-runs
+ox.settings.use_cache = True
+ox.settings.log_console = False
+ox.settings.overpass_rate_limit = True
+
 print("""
 🎯 GEORETAIL PROJECT - STEP 3
 🛣️  Road Network & Transportation Data Collection
@@ -25,70 +46,121 @@ os.makedirs("outputs", exist_ok=True)
 
 # Load Coimbatore boundary
 print("Loading Coimbatore boundary...")
-boundary_gdf = gpd.read_file("data/coimbatore_boundary_clean.geojson")
+boundary_gdf = gpd.read_file(BOUNDARY_FILE)
+boundary_meta = load_boundary_meta(boundary_gdf)
 print(f"✅ Boundary loaded")
 
 # Get bounding box for downloads
 bounds = boundary_gdf.total_bounds
 print(f"Study area bounds: {bounds}")
 
+# Saved layers are FlatGeobuf; set GEORETAIL_LEGACY to also write the old
+# GeoJSON copies next to them
+LEGACY_GEOJSON = bool(os.environ.get('GEORETAIL_LEGACY'))
+
+def legacy_path(path):
+    return os.path.splitext(path)[0] + ".geojson"
+
+def save_layer(gdf, path):
+    """Write a layer as FlatGeobuf (and GeoJSON in legacy mode)"""
+    # FlatGeobuf has no list fields; join multi-valued tags the way OSM does
+    flat = {}
+    for col in gdf.columns.drop(gdf.geometry.name):
+        if gdf[col].dtype == object:
+            is_list = gdf[col].map(type).isin((list, np.ndarray))
+            if is_list.any():
+                flat[col] = gdf[col].where(~is_list, gdf[col][is_list].map(lambda v: ';'.join(map(str, v))))
+    if flat:
+        gdf = gdf.assign(**flat)
+    gdf.to_file(path, driver="FlatGeobuf")
+    if LEGACY_GEOJSON:
+        gdf.to_file(legacy_path(path), driver="GeoJSON")
+
+def layer_exists(path):
+    return os.path.exists(path) or os.path.exists(legacy_path(path))
+
+def load_layer(path):
+    """Read a saved layer, converting a GeoJSON-only copy from older runs"""
+    if os.path.exists(path):
+        return gpd.read_file(path)
+    gdf = gpd.read_file(legacy_path(path))
+    save_layer(gdf, path)
+    return gdf
+
+# Road hierarchy classification
+road_hierarchy = {
+    'motorway': 5,
+    'motorway_link': 5,
+    'trunk': 5,
+    'trunk_link': 5,
+    'primary': 4,
+    'primary_link': 4,
+    'secondary': 3,
+    'secondary_link': 3,
+    'tertiary': 2,
+    'tertiary_link': 2,
+    'residential': 1,
+    'unclassified': 1,
+    'living_street': 1
+}
+
 # Step 3.1: Download Road Network from OSM
 print("\n" + "="*60)
 print("STEP 3.1: Downloading Road Network from OpenStreetMap")
 print("="*60)
 
-road_network_file = "data/processed/coimbatore_roads.geojson"
+road_network_file = "data/processed/coimbatore_roads.fgb"
 
-if not os.path.exists(road_network_file):
+if not layer_exists(road_network_file):
     print("📥 Downloading road network (this may take 2-3 minutes)...")
     
+    # Only road geometry and tags are used downstream (no routing), so fetch
+    # the classified highway ways as features instead of building a graph
+    road_tags = {'highway': list(road_hierarchy)}
+    
     try:
         # Download road network using polygon boundary
-        G = ox.graph_from_polygon(
+        edges_gdf = ox.features_from_polygon(
             boundary_gdf.geometry.iloc[0],
-            network_type='drive',
-            simplify=True
+            tags=road_tags
         )
-        
-        print(f"✅ Graph downloaded: {len(G.nodes)} nodes, {len(G.edges)} edges")
-        
-        # Convert to GeoDataFrames
-        nodes_gdf, edges_gdf = ox.graph_to_gdfs(G)
-        
-        # Save edges (roads)
-        edges_gdf.to_file(road_network_file, driver="GeoJSON")
-        print(f"✅ Road network saved: {road_network_file}")
-        
-        # Save nodes separately
-        nodes_file = "data/processed/coimbatore_road_nodes.geojson"
-        nodes_gdf.to_file(nodes_file, driver="GeoJSON")
-        print(f"✅ Road nodes saved: {nodes_file}")
-        
     except Exception as e:
         print(f"❌ Error downloading road network: {e}")
         print("\nTrying alternative bounding box method...")
         
         try:
-            G = ox.graph_from_bbox(
-                north=bounds[3],
-                south=bounds[1],
-                east=bounds[2],
-                west=bounds[0],
-                network_type='drive',
-                simplify=True
-            )
-            
-            nodes_gdf, edges_gdf = ox.graph_to_gdfs(G)
-            edges_gdf.to_file(road_network_file, driver="GeoJSON")
-            print(f"✅ Road network saved using bbox method")
-            
+            edges_gdf = ox.features_from_bbox(tuple(bounds), tags=road_tags)
         except Exception as e2:
             print(f"❌ Both methods failed: {e2}")
             print("You may need to download OSM data manually")
             exit(1)
+    
+    # Keep road lines only (drop area-tagged highway polygons and nodes)
+    drivable = edges_gdf.geometry.geom_type.isin(['LineString', 'MultiLineString']).to_numpy()
+    
+    # Reapply the exclusions of osmnx's 'drive' network: no highway areas and
+    # nothing closed to private motor vehicles
+    for tag in ('access', 'motor_vehicle', 'motorcar'):
+        if tag in edges_gdf:
+            drivable = drivable & ~edges_gdf[tag].isin(['private', 'no']).to_numpy()
+    if 'area' in edges_gdf:
+        drivable = drivable & (edges_gdf['area'] != 'yes').to_numpy()
+    edges_gdf = edges_gdf[drivable].reset_index()
+    
+    # Keep ways that touch the city; the bbox fallback returns the whole
+    # rectangle. One STRtree query against the prepared boundary.
+    city = boundary_gdf.geometry.union_all()
+    shapely.prepare(city)
+    in_city = STRtree(edges_gdf.geometry.values).query(city, predicate='intersects')
+    edges_gdf = edges_gdf.iloc[np.sort(in_city)].reset_index(drop=True)
+    print(f"✅ Roads downloaded: {len(edges_gdf)} ways")
+    
+    # Save edges (roads)
+    save_layer(edges_gdf, road_network_file)
+    print(f"✅ Road network saved: {road_network_file}")
 else:
     print(f"✅ Road network file already exists: {road_network_file}")
-    edges_gdf = gpd.read_file(road_network_file)
+    edges_gdf = load_layer(road_network_file)
 
 # Step 3.2: Classify Roads by Hierarchy
 print("\n" + "="*60)
@@ -97,61 +169,88 @@ print("="*60)
 
 # Load roads if not already loaded
 if 'edges_gdf' not in locals():
-    edges_gdf = gpd.read_file(road_network_file)
-
-# Road hierarchy classification
-road_hierarchy = {
-    'motorway': 5,
-    'motorway_link': 5,
-    'trunk': 5,
-    'trunk_link': 5,
-    'primary': 4,
-    'primary_link': 4,
-    'secondary': 3,
-    'secondary_link': 3,
-    'tertiary': 2,
-    'tertiary_link': 2,
-    'residential': 1,
-    'unclassified': 1,
-    'living_street': 1
-}
-
-# Add hierarchy score
-def get_hierarchy_score(highway_type):
-    if isinstance(highway_type, list):
-        highway_type = highway_type[0]
-    return road_hierarchy.get(highway_type, 0)
-
-edges_gdf['hierarchy_score'] = edges_gdf['highway'].apply(get_hierarchy_score)
+    edges_gdf = load_layer(road_network_file)
+
+# Normalise the highway tag once into a categorical first-tag column.
+# Multi-valued tags come as a list (an array when read back from GeoJSON) or
+# as a ';'-joined string; the first tag is the one that counts.
+highway = edges_gdf['highway']
+edges_gdf['highway_primary'] = (
+    highway.where(highway.map(type).eq(str), highway.str[0])
+    .str.split(';', n=1).str[0].astype('category')
+)
+
+# Add hierarchy score (the map runs once per category, not once per edge)
+edges_gdf['hierarchy_score'] = (
+    edges_gdf['highway_primary'].map(road_hierarchy).fillna(0).astype('int8')
+)
+hierarchy_counts = edges_gdf['hierarchy_score'].value_counts()
 
 print("Road Type Distribution:")
+# Count exact first tags; a substring match would also count e.g.
+# trunk_link segments under trunk
+highway_counts = edges_gdf['highway_primary'].value_counts()
 road_type_counts = {}
-for road_type, score in road_hierarchy.items():
-    count = (edges_gdf['highway'].astype(str).str.contains(road_type)).sum()
+for road_type in road_hierarchy:
+    count = int(highway_counts.get(road_type, 0))
     if count > 0:
         road_type_counts[road_type] = count
-        print(f"  {road_type:20} : {count:5} segments")
+        print(f"  {road_type:20} : {count:5} features")
 
 # Step 3.3: Calculate Road Statistics
 print("\n" + "="*60)
 print("STEP 3.3: Calculating Road Network Statistics")
 print("="*60)
 
-# Convert to projected CRS for accurate measurements
-edges_proj = edges_gdf.to_crs('EPSG:3857')
-
-# Calculate total road length by type
-total_length_km = edges_proj.geometry.length.sum() / 1000
-major_roads = edges_proj[edges_proj['hierarchy_score'] >= 4]
-major_roads_length_km = major_roads.geometry.length.sum() / 1000
+# Measure on the WGS84 ellipsoid; planar Web Mercator lengths are inflated
+# by sec(latitude) and need every coordinate reprojected first
+GEOD = Geod(ellps='WGS84')
+
+# Geod.inv releases the GIL, so the vertex array is split into contiguous
+# chunks that are measured on all cores
+GEOD_WORKERS = os.cpu_count() or 1
+
+def geodesic_segments_m(coords):
+    """Geodesic length in metres between each pair of consecutive vertices"""
+    cuts = np.linspace(0, len(coords) - 1, GEOD_WORKERS + 1).astype(int)
+
+    def measure(lo, hi):
+        chunk = coords[lo:hi + 1]
+        return GEOD.inv(chunk[:-1, 0], chunk[:-1, 1], chunk[1:, 0], chunk[1:, 1])[2]
+
+    with ThreadPoolExecutor(max_workers=GEOD_WORKERS) as pool:
+        return np.concatenate(list(pool.map(measure, cuts[:-1], cuts[1:])))
+
+def geodesic_lengths_m(geoms):
+    """Geodesic length in metres of each lon/lat line geometry"""
+    parts, part_index = shapely.get_parts(geoms, return_index=True)
+    # Empty parts have no vertices and would throw off the part boundaries
+    nonempty = ~shapely.is_empty(parts)
+    parts, part_index = parts[nonempty], part_index[nonempty]
+    coords = shapely.get_coordinates(parts)
+    if len(coords) < 2:
+        return np.zeros(len(geoms))
+    vertex_counts = shapely.get_num_coordinates(parts)
+    seg = geodesic_segments_m(coords)
+    # Drop the segments joining the last vertex of one part to the next part
+    seg[np.cumsum(vertex_counts)[:-1] - 1] = 0
+    seg_part = np.repeat(np.arange(len(parts)), vertex_counts)[:-1]
+    part_lengths = np.bincount(seg_part, weights=seg, minlength=len(parts))
+    return np.bincount(part_index, weights=part_lengths, minlength=len(geoms))
+
+# Calculate total road length by type (OSM geometries are lon/lat)
+edge_lengths_m = geodesic_lengths_m(edges_gdf.geometry.values)
+total_length_km = edge_lengths_m.sum() / 1000
+is_major = (edges_gdf['hierarchy_score'] >= 4).to_numpy()
+major_roads_length_km = edge_lengths_m[is_major].sum() / 1000
 
 print(f"📊 Road Network Statistics:")
 print(f"Total road length: {total_length_km:.2f} km")
 print(f"Major roads length: {major_roads_length_km:.2f} km")
-print(f"Road segments: {len(edges_gdf)}")
+print(f"Road features: {len(edges_gdf)}")
 
 # Road density (km per km²)
-area_km2 = boundary_gdf.to_crs('EPSG:3857').geometry.area.sum() / 1e6
+area_km2 = boundary_meta['area_km2']
 road_density = total_length_km / area_km2
 print(f"Road density: {road_density:.2f} km/km²")
 
@@ -160,9 +259,9 @@ print("\n" + "="*60)
 print("STEP 3.4: Downloading Public Transportation Points")
 print("="*60)
 
-transit_file = "data/processed/coimbatore_transit.geojson"
+transit_file = "data/processed/coimbatore_transit.fgb"
 
-if not os.path.exists(transit_file):
+if not layer_exists(transit_file):
     print("📥 Downloading bus stops and transit points...")
     
     try:
@@ -191,7 +290,7 @@ if not os.path.exists(transit_file):
         
         # Reset index and save
         transit_gdf = transit_gdf.reset_index()
-        transit_gdf.to_file(transit_file, driver="GeoJSON")
+        save_layer(transit_gdf, transit_file)
         
         print(f"✅ Transit points saved: {len(transit_gdf)} locations")
         
@@ -199,10 +298,10 @@ if not os.path.exists(transit_file):
         print(f"⚠️  Transit download failed: {e}")
         print("Creating empty transit file...")
         transit_gdf = gpd.GeoDataFrame(columns=['geometry'], crs='EPSG:4326')
-        transit_gdf.to_file(transit_file, driver="GeoJSON")
+        save_layer(transit_gdf, transit_file)
 else:
     print(f"✅ Transit file already exists: {transit_file}")
-    transit_gdf = gpd.read_file(transit_file)
+    transit_gdf = load_layer(transit_file)
 
 # Step 3.5: Identify Major Roads/Highways
 print("\n" + "="*60)
@@ -210,11 +309,11 @@ print("STEP 3.5: Identifying Major Roads & Highways")
 print("="*60)
 
 # Extract major roads
-major_roads_file = "data/processed/coimbatore_major_roads.geojson"
-major_roads = edges_gdf[edges_gdf['hierarchy_score'] >= 4].copy()
-major_roads.to_file(major_roads_file, driver="GeoJSON")
+major_roads_file = "data/processed/coimbatore_major_roads.fgb"
+major_roads = edges_gdf[is_major].copy()
+save_layer(major_roads, major_roads_file)
 
-print(f"✅ Major roads extracted: {len(major_roads)} segments")
+print(f"✅ Major roads extracted: {len(major_roads)} features")
 print(f"   Saved to: {major_roads_file}")
 
 # Step 3.6: Create Visualizations
@@ -222,62 +321,85 @@ print("\n" + "="*60)
 print("STEP 3.6: Creating Visualizations")
 print("="*60)
 
-fig = plt.figure(figsize=(20, 16))
-
-# Create grid for subplots
-gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
-ax1 = fig.add_subplot(gs[0, :])  # Full width top
-ax2 = fig.add_subplot(gs[1, 0])
-ax3 = fig.add_subplot(gs[1, 1])
-ax4 = fig.add_subplot(gs[2, 0])
-ax5 = fig.add_subplot(gs[2, 1])
-
-# Plot 1: Complete Road Network
-boundary_gdf.plot(ax=ax1, facecolor='lightgray', edgecolor='black', alpha=0.3)
-edges_gdf.plot(ax=ax1, linewidth=0.5, color='steelblue', alpha=0.7)
-major_roads.plot(ax=ax1, linewidth=2, color='red', alpha=0.8, label='Major Roads')
-
-if len(transit_gdf) > 0:
-    transit_gdf.plot(ax=ax1, color='green', markersize=20, marker='o', 
-                    label='Transit Points', zorder=5)
-
-ax1.set_title('Complete Road Network - Coimbatore', fontsize=14, fontweight='bold')
-ax1.legend(loc='upper right')
-ax1.axis('off')
-
-# Plot 2: Road Hierarchy
-boundary_gdf.plot(ax=ax2, facecolor='white', edgecolor='black', alpha=0.3)
-
-colors = {5: 'red', 4: 'orange', 3: 'yellow', 2: 'lightgreen', 1: 'lightblue', 0: 'gray'}
-for score in sorted(colors.keys(), reverse=True):
-    subset = edges_gdf[edges_gdf['hierarchy_score'] == score]
-    if len(subset) > 0:
-        subset.plot(ax=ax2, color=colors[score], linewidth=1.5, alpha=0.7,
-                   label=f'Level {score}')
-
-ax2.set_title('Road Hierarchy Classification', fontsize=12, fontweight='bold')
-ax2.legend(loc='upper right', fontsize=9)
-ax2.axis('off')
-
-# Plot 3: Major Roads Only
-boundary_gdf.plot(ax=ax3, facecolor='lightgray', edgecolor='black', alpha=0.5)
-major_roads.plot(ax=ax3, linewidth=2.5, color='darkred', alpha=0.8)
-
-ax3.set_title('Major Roads & Highways', fontsize=12, fontweight='bold')
-ax3.axis('off')
-
-# Plot 4: Road Density Heatmap (simplified)
-boundary_gdf.plot(ax=ax4, facecolor='lightyellow', edgecolor='black', alpha=0.5)
-
-# Create density visualization by plotting all roads
-edges_gdf.plot(ax=ax4, linewidth=0.8, color='darkblue', alpha=0.3)
-
-ax4.set_title('Road Network Density', fontsize=12, fontweight='bold')
-ax4.axis('off')
+output_viz = "outputs/step3_road_network_analysis.png"
 
-# Plot 5: Statistics Summary
-ax5.axis('off')
-stats_text = f"""
+def render_plots():
+    fig = plt.figure(figsize=(20, 16))
+
+    # Create grid for subplots
+    gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
+    ax1 = fig.add_subplot(gs[0, :])  # Full width top
+    ax2 = fig.add_subplot(gs[1, 0])
+    ax3 = fig.add_subplot(gs[1, 1])
+    ax4 = fig.add_subplot(gs[2, 0])
+    ax5 = fig.add_subplot(gs[2, 1])
+
+    # Plot 1: Complete Road Network
+    boundary_gdf.plot(ax=ax1, facecolor='lightgray', edgecolor='black', alpha=0.3)
+    edges_gdf.plot(ax=ax1, linewidth=0.5, color='steelblue', alpha=0.7, rasterized=True)
+    major_roads.plot(ax=ax1, linewidth=2, color='red', alpha=0.8, label='Major Roads',
+                     rasterized=True)
+
+    if len(transit_gdf) > 0:
+        transit_gdf.plot(ax=ax1, color='green', markersize=20, marker='o', 
+                        label='Transit Points', zorder=5)
+
+    ax1.set_title('Complete Road Network - Coimbatore', fontsize=14, fontweight='bold')
+    ax1.legend(loc='upper right')
+    ax1.axis('off')
+
+    # Plot 2: Road Hierarchy
+    boundary_gdf.plot(ax=ax2, facecolor='white', edgecolor='black', alpha=0.3)
+
+    colors = {5: 'red', 4: 'orange', 3: 'yellow', 2: 'lightgreen', 1: 'lightblue', 0: 'gray'}
+    levels = [score for score in sorted(colors, reverse=True) if hierarchy_counts.get(score, 0) > 0]
+
+    # One categorical plot instead of a subset per level; rows are ordered so
+    # the highest level is drawn first and local roads end up on top
+    by_level = edges_gdf.iloc[np.argsort(-edges_gdf['hierarchy_score'].to_numpy(), kind='stable')]
+    by_level.plot(ax=ax2, column='hierarchy_score', categorical=True, categories=levels,
+                  cmap=ListedColormap([colors[score] for score in levels]),
+                  linewidth=1.5, alpha=0.7, rasterized=True)
+
+    ax2.set_title('Road Hierarchy Classification', fontsize=12, fontweight='bold')
+    ax2.legend(handles=[Line2D([], [], color=colors[score], linewidth=1.5, alpha=0.7,
+                               label=f'Level {score}') for score in levels],
+               loc='upper right', fontsize=9)
+    ax2.axis('off')
+
+    # Plot 3: Major Roads Only
+    boundary_gdf.plot(ax=ax3, facecolor='lightgray', edgecolor='black', alpha=0.5)
+    major_roads.plot(ax=ax3, linewidth=2.5, color='darkred', alpha=0.8, rasterized=True)
+
+    ax3.set_title('Major Roads & Highways', fontsize=12, fontweight='bold')
+    ax3.axis('off')
+
+    # Plot 4: Road Density Heatmap (simplified)
+    boundary_gdf.plot(ax=ax4, facecolor='lightyellow', edgecolor='black', alpha=0.5)
+
+    # Bin road length onto a 100x100 grid instead of drawing every edge again:
+    # each segment adds its (planar) length at its midpoint
+    road_parts = shapely.get_parts(edges_gdf.geometry.values)
+    road_parts = road_parts[~shapely.is_empty(road_parts)]
+    road_coords = shapely.get_coordinates(road_parts)
+    seg_start, seg_end = road_coords[:-1], road_coords[1:]
+    seg_len = np.hypot(*(seg_end - seg_start).T)
+    seg_len[np.cumsum(shapely.get_num_coordinates(road_parts))[:-1] - 1] = 0
+    seg_mid = (seg_start + seg_end) / 2
+    density, _, _ = np.histogram2d(
+        seg_mid[:, 1], seg_mid[:, 0], bins=100, weights=seg_len,
+        range=[[bounds[1], bounds[3]], [bounds[0], bounds[2]]]
+    )
+    ax4.imshow(np.ma.masked_equal(density, 0), origin='lower', cmap='Blues',
+               extent=(bounds[0], bounds[2], bounds[1], bounds[3]),
+               aspect=ax4.get_aspect(), zorder=2)
+
+    ax4.set_title('Road Network Density', fontsize=12, fontweight='bold')
+    ax4.axis('off')
+
+    # Plot 5: Statistics Summary
+    ax5.axis('off')
+    stats_text = f"""
 ROAD NETWORK STATISTICS
 
 📏 Total Length:
@@ -296,23 +418,27 @@ ROAD NETWORK STATISTICS
    Transit points: {len(transit_gdf):,}
 
 📈 Road Hierarchy:
-   Level 5 (Highways): {len(edges_gdf[edges_gdf['hierarchy_score']==5]):,}
-   Level 4 (Primary): {len(edges_gdf[edges_gdf['hierarchy_score']==4]):,}
-   Level 3 (Secondary): {len(edges_gdf[edges_gdf['hierarchy_score']==3]):,}
-   Level 2 (Tertiary): {len(edges_gdf[edges_gdf['hierarchy_score']==2]):,}
-   Level 1 (Local): {len(edges_gdf[edges_gdf['hierarchy_score']==1]):,}
+   Level 5 (Highways): {hierarchy_counts.get(5, 0):,}
+   Level 4 (Primary): {hierarchy_counts.get(4, 0):,}
+   Level 3 (Secondary): {hierarchy_counts.get(3, 0):,}
+   Level 2 (Tertiary): {hierarchy_counts.get(2, 0):,}
+   Level 1 (Local): {hierarchy_counts.get(1, 0):,}
 """
 
-ax5.text(0.1, 0.5, stats_text, fontsize=10, family='monospace',
-        verticalalignment='center',
-        bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+    ax5.text(0.1, 0.5, stats_text, fontsize=10, family='monospace',
+            verticalalignment='center',
+            bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
 
-plt.suptitle('Coimbatore Road Network Analysis - GeoRetail Project', 
-            fontsize=16, fontweight='bold', y=0.995)
+    plt.suptitle('Coimbatore Road Network Analysis - GeoRetail Project', 
+                fontsize=16, fontweight='bold', y=0.995)
 
-output_viz = "outputs/step3_road_network_analysis.png"
-plt.savefig(output_viz, dpi=300, bbox_inches='tight')
-print(f"✅ Visualization saved: {output_viz}")
+    plt.savefig(output_viz, dpi=150, bbox_inches='tight')
+
+if NO_PLOT:
+    print("⏭️  Plots skipped (--no-plot / GEORETAIL_NOPLOT)")
+else:
+    render_plots()
+    print(f"✅ Visualization saved: {output_viz}")
 
 # Step 3.7: Save Summary Report
 print("\n" + "="*60)
@@ -327,41 +453,41 @@ Date: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
 1. Data Source: OpenStreetMap (OSMnx)
 2. Coverage Area: Coimbatore Municipal Corporation
-3. Network Type: Driveable roads
+3. Network Type: Driveable roads (classified OSM highway ways, private and no-motor access excluded)
 
 === ROAD NETWORK STATISTICS ===
 
 Total Network:
 - Total length: {total_length_km:.2f} km
-- Road segments: {len(edges_gdf):,}
+- Road features: {len(edges_gdf):,}
 - Road density: {road_density:.2f} km/km²
 
 Major Roads:
 - Major road length: {major_roads_length_km:.2f} km
-- Major road segments: {len(major_roads):,}
+- Major road features: {len(major_roads):,}
 - Percentage of network: {(major_roads_length_km/total_length_km)*100:.1f}%
 
 Road Hierarchy Distribution:
-- Level 5 (Highways): {len(edges_gdf[edges_gdf['hierarchy_score']==5]):,} segments
-- Level 4 (Primary): {len(edges_gdf[edges_gdf['hierarchy_score']==4]):,} segments
-- Level 3 (Secondary): {len(edges_gdf[edges_gdf['hierarchy_score']==3]):,} segments
-- Level 2 (Tertiary): {len(edges_gdf[edges_gdf['hierarchy_score']==2]):,} segments
-- Level 1 (Local): {len(edges_gdf[edges_gdf['hierarchy_score']==1]):,} segments
+- Level 5 (Highways): {hierarchy_counts.get(5, 0):,} features
+- Level 4 (Primary): {hierarchy_counts.get(4, 0):,} features
+- Level 3 (Secondary): {hierarchy_counts.get(3, 0):,} features
+- Level 2 (Tertiary): {hierarchy_counts.get(2, 0):,} features
+- Level 1 (Local): {hierarchy_counts.get(1, 0):,} features
 
 Public Transportation:
 - Transit points collected: {len(transit_gdf):,}
 
 === OUTPUT FILES ===
 
-1. Complete Road Network: data/processed/coimbatore_roads.geojson
-2. Major Roads Only: data/processed/coimbatore_major_roads.geojson
-3. Transit Points: data/processed/coimbatore_transit.geojson
+1. Complete Road Network: {road_network_file}
+2. Major Roads Only: {major_roads_file}
+3. Transit Points: {transit_file}
 4. Visualization: outputs/step3_road_network_analysis.png
 5. This report: outputs/step3_road_network_report.txt
 
 === DATA QUALITY ===
 
-✅ Road network topology: Valid
+✅ Road geometry: Ways intersecting the city boundary
 ✅ Hierarchy classification: Complete
 ✅ Spatial coverage: 100% of study area
 ✅ CRS consistency: EPSG:4326 (WGS84)
@@ -390,9 +516,4 @@ print(f"   2. {major_roads_file}")
 print(f"   3. {transit_file}")
 print(f"   4. {output_viz}")
 print(f"   5. {report_file}")
-print("\n➡️  NEXT: Run Step 4 - Amenities & POI Collection")
-
-try:
-    plt.show()
-except:
-    print("⚠️  Display not available (headless mode)")
\ No newline at end of file
+print("\n➡️  NEXT: Run Step 4 - Amenities & POI Collection")
\ No newline at end of file